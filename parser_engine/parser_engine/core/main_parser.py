@@ -1,38 +1,135 @@
+import logging
+import os
+import sys
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import List, Dict, Optional, Tuple, Union
+from collections import deque
 from ..language_parsers.python_parser import PythonParser
-from ..models.data_models import FunctionElement, ModuleElement, FunctionCallElement
+from ..models.data_models import (
+    FunctionElement, ModuleElement, FunctionCallElement,
+    DirectoryTree, DirectoryNode, FileNode
+)
 from .repo_analyzer import RepoIndexer
+from ..utils.module_cache import ModuleCache
 
 
+# Directories that never contain project sources; pruned before descent.
+_SKIP_DIRS = frozenset({
+    ".git", "__pycache__", "node_modules", ".venv", "venv", "build", "dist"
+})
+
 class MainParser:
     def __init__(self, repo_path: Path):
+        self.logger = logging.getLogger(self.__class__.__name__)
         self.repo_path = repo_path
         self.parser = PythonParser()
+        self.module_cache = ModuleCache(repo_path / ".parser_engine_cache")
         self.modules = []
         self.indexer = None
         self.call_graph = {}
+        self.directory_tree = None
 
     def parse_repo(self):
         """
         Parse all Python files in the repository and store the resulting modules.
+
+        Parsing is CPU-bound and per-file independent, so files are dispatched
+        to a process pool; only the indexing phase below runs serially.
         """
         self.modules = []
         if not self.repo_path.exists():
             raise FileNotFoundError(f"The repository path {self.repo_path} does not exist.")
-        for file_path in self.repo_path.rglob("*.py"):
-            if self.parser.can_parse(file_path):
-                try:
-                    module = self.parser.parse_file(file_path, repo_root=self.repo_path)
-                    self.modules.append(module)
-                except Exception as e:
-                    print(f"Error parsing {file_path}: {e}")
+
+        # os.walk avoids the per-entry PurePath construction and re-stats of
+        # Path.rglob, and lets us prune vendored/VCS directories in place.
+        file_paths = []
+        for root, dirs, files in os.walk(self.repo_path):
+            dirs[:] = [
+                d for d in dirs if d not in _SKIP_DIRS and not d.startswith(".")
+            ]
+            for file_name in files:
+                if file_name.endswith((".py", ".pyw")):
+                    file_paths.append(os.path.join(root, file_name))
+        # Unchanged files (same path/mtime/size) come straight from the
+        # on-disk cache; only the rest go to the process pool.
+        to_parse = []
+        for file_path in file_paths:
+            module = self.module_cache.get(file_path)
+            if module is not None:
+                self.modules.append(module)
+            else:
+                to_parse.append(file_path)
+        self.logger.info(
+            "Module cache: %d/%d hits", len(file_paths) - len(to_parse), len(file_paths))
+
+        if to_parse:
+            parsed = self.parser.parse_files(to_parse, repo_root=self.repo_path)
+            for file_path, module in zip(to_parse, parsed):
+                self.modules.append(module)
+                if module.error is None:
+                    self.module_cache.put(file_path, module)
 
         # Create and run the indexer
         self.indexer = RepoIndexer(self.modules)
         self.indexer.index_repository()
 
+    def _build_directory_tree(self) -> DirectoryTree:
+        """
+        Build a DirectoryTree of the repository with an iterative os.scandir walk.
+
+        os.scandir yields DirEntry objects whose is_file/is_dir and stat
+        results are cached, so each entry costs at most one stat syscall; an
+        explicit work stack avoids Python recursion limits on deep trees.
+        Hidden entries are skipped by name before any stat happens.
+        """
+        if not self.repo_path.exists():
+            raise FileNotFoundError(f"The repository path {self.repo_path} does not exist.")
+
+        root_node = DirectoryNode(name=self.repo_path.name, path=self.repo_path)
+        stack = deque([(root_node, str(self.repo_path))])
+        # (parent, child) directory pairs in discovery order, for the
+        # bottom-up totals pass below.
+        edges: List[Tuple[DirectoryNode, DirectoryNode]] = []
+
+        while stack:
+            parent_node, dir_path = stack.pop()
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        child = DirectoryNode(name=entry.name, path=Path(entry.path))
+                        parent_node.subdirectories.append(child)
+                        edges.append((parent_node, child))
+                        stack.append((child, entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        # One cached stat per entry; follow_symlinks=False
+                        # reuses the readdir d_type data and never dereferences.
+                        st = entry.stat(follow_symlinks=False)
+                        file_path = Path(entry.path)
+                        parent_node.add_file(FileNode(
+                            name=entry.name,
+                            path=file_path,
+                            size_bytes=st.st_size,
+                            last_modified=datetime.fromtimestamp(st.st_mtime),
+                            extension=file_path.suffix.lower(),
+                            content_type='other'
+                        ))
+
+        # A child's edge is always recorded after its parent's, so walking the
+        # edges in reverse propagates subtree totals bottom-up in one pass.
+        for parent, child in reversed(edges):
+            parent.total_files += child.total_files
+            parent.total_size_bytes += child.total_size_bytes
+            if child.last_modified and (
+                not parent.last_modified or child.last_modified > parent.last_modified
+            ):
+                parent.last_modified = child.last_modified
+
+        self.directory_tree = DirectoryTree(root=root_node)
+        return self.directory_tree
+
     def build_call_graph(self):
         """
         Build the function call graph for the parsed repository.
@@ -40,28 +137,36 @@ class MainParser:
         if not self.indexer:
             raise RuntimeError("Repository must be parsed before building the call graph.")
 
-        call_graph = defaultdict(list)
+        # Edges collect into per-caller dicts used as ordered sets, so a
+        # function calling the same helper five times contributes one edge;
+        # the symbol table is hoisted to a local for the inner loops.
+        edges: Dict[str, Dict[str, None]] = {}
         symbol_table = self.indexer.symbol_table
 
         for module in self.modules:
             # Process functions
             for func in module.functions:
-                caller = func.qualified_name
-                if caller and caller in symbol_table:
-                    for call in func.function_calls:
-                        if call.resolved_name and call.resolved_name in symbol_table:
-                            call_graph[caller].append(call.resolved_name)
+                self._add_call_edges(func, edges, symbol_table)
 
             # Process class methods
             for cls in module.classes:
                 for method in cls.methods:
-                    caller = method.qualified_name
-                    if caller and caller in symbol_table:
-                        for call in method.function_calls:
-                            if call.resolved_name and call.resolved_name in symbol_table:
-                                call_graph[caller].append(call.resolved_name)
+                    self._add_call_edges(method, edges, symbol_table)
+
+        self.call_graph = {caller: list(callees) for caller, callees in edges.items()}
 
-        self.call_graph = dict(call_graph)
+    def _add_call_edges(self, func: FunctionElement, edges: Dict[str, Dict[str, None]], symbol_table: Dict) -> None:
+        """Record resolved, deduplicated call edges for one function."""
+        caller = func.qualified_name
+        if not caller or caller not in symbol_table:
+            return
+        bucket = None
+        for call in func.function_calls:
+            resolved = call.resolved_name
+            if resolved and resolved in symbol_table:
+                if bucket is None:
+                    bucket = edges.setdefault(caller, {})
+                bucket[resolved] = None
 
     def get_function_source_code(self, function_name: str) -> str:
         """
@@ -75,18 +180,22 @@ class MainParser:
             raise ValueError(f"Function {function_name} not found in symbol table.")
 
         module = func_elem.module
-        source_lines = module.body.splitlines()[func_elem.start_line - 1:func_elem.end_line]
+        source_lines = module.get_body_lines()[func_elem.start_line - 1:func_elem.end_line]
         return "\n".join(source_lines)
 
     def group_calls_by_line(self, function: FunctionElement) -> Dict[int, List[FunctionCallElement]]:
         """
         Group function calls by line number within a function.
+
+        The grouping is precomputed once by RepoIndexer.index_repository;
+        this is a plain attribute read on the display path. The symbol
+        table also resolves constructor calls to ClassElements, which
+        carry no call index (and slots forbid stamping one on), so
+        anything that is not a FunctionElement groups to nothing.
         """
-        calls_by_line = defaultdict(list)
-        for call in function.function_calls:
-            if call.resolved_name in self.indexer.symbol_table:
-                calls_by_line[call.line_number - 1].append(call)
-        return dict(calls_by_line)
+        if not isinstance(function, FunctionElement):
+            return {}
+        return function.calls_by_line
 
     def display_function_source_and_calls(
         self,
@@ -95,44 +204,82 @@ class MainParser:
         indent: int = 0
     ):
         """
-        Display the source code of a function and its calls, expanding inlined calls recursively.
+        Display the source code of a function and its calls, expanding inlined calls.
+
+        Runs an explicit-stack DFS instead of recursion (no recursion limit on
+        deep call graphs) and batches all output into a single stdout write so
+        we pay the stdio lock/flush cost once, not once per line.
         """
         if not self.indexer:
             raise RuntimeError("Repository must be parsed before displaying function source and calls.")
 
-        if visited_stack is None:
-            visited_stack = []
+        pad_cache: Dict[int, str] = {}
 
-        if func_fqn in visited_stack:
-            print(" " * indent + f"(cycle) {func_fqn} ... {' -> '.join(visited_stack)} -> {func_fqn}")
-            return
+        def pad(width: int) -> str:
+            padding = pad_cache.get(width)
+            if padding is None:
+                padding = " " * width
+                pad_cache[width] = padding
+            return padding
 
-        visited_stack.append(func_fqn)
-        func_elem = self.indexer.symbol_table.get(func_fqn)
+        out: List[str] = []
+        # Stack items are either pre-rendered lines to emit, or
+        # (fqn, indent, visited path, visited set) frames to expand in place.
+        # The tuple keeps ordering for the cycle message; the frozenset gives
+        # O(1) membership instead of a linear scan per frame.
+        initial_path = tuple(visited_stack) if visited_stack else ()
+        stack: List[Union[str, Tuple[str, int, Tuple[str, ...], frozenset]]] = [
+            (func_fqn, indent, initial_path, frozenset(initial_path))
+        ]
 
-        if not func_elem:
-            print(" " * indent + f"* {func_fqn} (unresolved or built-in)")
-            visited_stack.pop()
-            return
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+
+            fqn, cur_indent, path, path_set = item
+            if fqn in path_set:
+                out.append(pad(cur_indent) + f"(cycle) {fqn} ... {' -> '.join(path)} -> {fqn}")
+                continue
+
+            func_elem = self.indexer.symbol_table.get(fqn)
+            if not func_elem:
+                out.append(pad(cur_indent) + f"* {fqn} (unresolved or built-in)")
+                continue
+            if not isinstance(func_elem, FunctionElement):
+                # Constructor calls resolve to ClassElements; render them
+                # terminally rather than expanding a whole class body into
+                # the caller's listing.
+                out.append(pad(cur_indent) + f"* {fqn} (class)")
+                continue
+
+            # Render this function's lines in order, then push them reversed
+            # so the DFS emits them (and expands callees) in source order.
+            frames: List[Union[str, Tuple[str, int, Tuple[str, ...], frozenset]]] = [
+                pad(cur_indent) + f"{func_elem.name}()"
+            ]
+            function_source_code = self.get_function_source_code(fqn)
+            if function_source_code:
+                source_lines = function_source_code.splitlines()
+                calls_by_line = self.group_calls_by_line(func_elem)
+                child_path = path + (fqn,)
+                child_path_set = path_set | {fqn}
+
+                for idx, line in enumerate(source_lines):
+                    frames.append(pad(cur_indent + 2) + line)
+                    if idx in calls_by_line:
+                        for call in calls_by_line[idx]:
+                            callee_fqn = call.resolved_name
+                            if callee_fqn:
+                                previous_line_length = len(source_lines[idx-1]) + cur_indent + 4 if idx > 0 else 0
+                                frames.append(pad(previous_line_length) + f"-> calls {callee_fqn}")
+                                frames.append((callee_fqn, previous_line_length + 3, child_path, child_path_set))
+                            else:
+                                frames.append(pad(cur_indent + 4) + f"-> calls {call.name} (unresolved)")
+            else:
+                frames.append(pad(cur_indent + 2) + "<No source available>")
+
+            stack.extend(reversed(frames))
 
-        print(" " * indent + f"{func_elem.name}()")
-        function_source_code = self.get_function_source_code(func_fqn)
-        if function_source_code:
-            source_lines = function_source_code.splitlines()
-            calls_by_line = self.group_calls_by_line(func_elem)
-
-            for idx, line in enumerate(source_lines):
-                print(" " * (indent + 2) + line)
-                if idx in calls_by_line:
-                    for call in calls_by_line[idx]:
-                        callee_fqn = call.resolved_name
-                        if callee_fqn:
-                            previous_line_length = len(source_lines[idx-1]) + indent + 4 if idx > 0 else 0
-                            print(" " * previous_line_length + f"-> calls {callee_fqn}")
-                            self.display_function_source_and_calls(callee_fqn, visited_stack, previous_line_length + 3)
-                        else:
-                            print(" " * (indent + 4) + f"-> calls {call.name} (unresolved)")
-        else:
-            print(" " * (indent + 2) + "<No source available>")
-
-        visited_stack.pop()
\ No newline at end of file
+        sys.stdout.write("\n".join(out) + "\n")
\ No newline at end of file
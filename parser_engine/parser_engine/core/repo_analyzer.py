@@ -3,41 +3,92 @@ from ..models.data_models import ModuleElement, FunctionElement, ClassElement, F
 from typing import Optional
 from ..language_parsers.python_parser import PythonFunctionCallVisitor
 import ast
+import builtins
+import hashlib
+import logging
+import sys
+
+# Computed once at import time. frozenset(dir(builtins)) is stable regardless
+# of whether __builtins__ is a module or a dict in the importing context.
+_BUILTINS: frozenset = frozenset(dir(builtins))
+
+# Distinguishes "never resolved" from a cached None in the resolve memo.
+_UNRESOLVED = object()
 
 class RepoIndexer:
     def __init__(self, modules: List[ModuleElement]):
+        self.logger = logging.getLogger(self.__class__.__name__)
         self.modules = modules
         self.symbol_table: Dict[str, Union[FunctionElement, ClassElement]] = {}
+        # Read-only membership view of the table, rebuilt after indexing;
+        # cross-reference passes can probe it without touching the dict.
+        self.symbol_names: frozenset = frozenset()
         self.module_name_map: Dict[str, ModuleElement] = {}
-        self._builtin_functions_set = set(__builtins__.keys())
+        self._builtin_functions_set = _BUILTINS
+        # Resolution is pure per (module, name); the same names repeat
+        # thousands of times across a repo, so memoize the outcome.
+        self._resolve_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # Parsed-source memo for the re-parse fallback, keyed by content
+        # hash so identical bodies (empty __init__.py and friends) share
+        # one tree without pinning the source strings.
+        self._ast_cache: Dict[bytes, ast.AST] = {}
+        # Share identical body strings across modules: monorepos carry many
+        # duplicate or boilerplate files, and one copy per distinct content
+        # is enough for everything downstream (get_body_lines included).
+        seen_bodies: Dict[bytes, str] = {}
+        for module in modules:
+            body = module.body
+            if body:
+                key = hashlib.blake2b(body.encode('utf-8'), digest_size=16).digest()
+                module.body = seen_bodies.setdefault(key, body)
+        # module name -> "module." prefix, precomputed so the hot lookup is
+        # one concatenation instead of f-string formatting per call.
+        self._local_prefixes: Dict[str, str] = {}
     
     def index_repository(self):
         self._build_module_name_map()
         self._build_symbol_table()
         self._resolve_function_calls()
+        self._precompute_call_line_index()
+        # Parsed trees are only needed during extraction; let them go
+        # rather than holding every fallback AST for the indexer's lifetime.
+        self._ast_cache.clear()
     
     def _build_module_name_map(self):
+        # Intern the names used as hot dict keys: modules arriving from the
+        # parse pool each carry their own string copies, and interned keys
+        # give the resolve path the identity-compare fast path. The shared
+        # 'Python' language string is deduplicated for the same reason.
+        intern = sys.intern
         for module in self.modules:
-            self.module_name_map[module.name] = module
+            module.name = intern(module.name)
+            if module.language:
+                module.language = intern(module.language)
+        self.module_name_map = {module.name: module for module in self.modules}
+        self._local_prefixes = {name: name + "." for name in self.module_name_map}
 
     def _build_symbol_table(self):
-        for module in self.modules:
-            module_prefix = module.name
-            # Index classes
-            for class_element in module.classes:
-                fq_class_name = f"{class_element.name}"
-                class_element.qualified_name = fq_class_name
-                self.symbol_table[fq_class_name] = class_element
-                # Index methods
-                for method in class_element.methods:
-                    fq_method_name = f"{method.name}"
-                    method.qualified_name = fq_method_name
-                    self.symbol_table[fq_method_name] = method
-            # Index functions
-            for function_element in module.functions:
-                fq_function_name = f"{function_element.name}"
-                function_element.qualified_name = fq_function_name
-                self.symbol_table[fq_function_name] = function_element
+        # Element names already carry their parent prefix from the parser.
+        # Interning them makes the membership tests in _resolve_call resolve
+        # by pointer equality and collapses duplicate strings.
+        intern = sys.intern
+
+        def _entries():
+            for module in self.modules:
+                # Index classes and their methods
+                for class_element in module.classes:
+                    class_element.qualified_name = intern(class_element.name)
+                    yield class_element.qualified_name, class_element
+                    for method in class_element.methods:
+                        method.qualified_name = intern(method.name)
+                        yield method.qualified_name, method
+                # Index functions
+                for function_element in module.functions:
+                    function_element.qualified_name = intern(function_element.name)
+                    yield function_element.qualified_name, function_element
+
+        self.symbol_table = dict(_entries())
+        self.symbol_names = frozenset(self.symbol_table)
 
     def _resolve_function_calls(self):
         for module in self.modules:
@@ -47,71 +98,137 @@ class RepoIndexer:
                 for method in class_element.methods:
                     self._resolve_function_calls_in_function(method, module)
     
+    def _precompute_call_line_index(self):
+        """Group each function's resolved calls by line while the symbol table
+        is hot, so the display path reads a cached mapping instead of
+        rebuilding it on every visit."""
+        symbol_names = self.symbol_names
+        for module in self.modules:
+            for function in module.functions:
+                self._index_call_lines(function, symbol_names)
+            for class_element in module.classes:
+                for method in class_element.methods:
+                    self._index_call_lines(method, symbol_names)
+
+    def _index_call_lines(self, function: FunctionElement, symbol_names: frozenset):
+        calls_by_line: Dict[int, List[FunctionCallElement]] = {}
+        for call in function.function_calls:
+            if call.resolved_name in symbol_names:
+                calls_by_line.setdefault(call.line_number - 1, []).append(call)
+        function.calls_by_line = calls_by_line
+
     def _resolve_function_calls_in_function(self, function: FunctionElement, module: ModuleElement):
-        # Extract function calls
-        function.function_calls = self._extract_function_calls(function, module)
+        # Extract function calls unless the parse workers already did
+        # (parse_files extracts in-pool; see _extract_module_calls).
+        if not function.function_calls:
+            function.function_calls = self._extract_function_calls(function, module)
+        resolve_cache = self._resolve_cache
         for call in function.function_calls:
-            resolved_name = self._resolve_call(call.name, function, module)
+            key = (module.name, call.name)
+            resolved_name = resolve_cache.get(key, _UNRESOLVED)
+            if resolved_name is _UNRESOLVED:
+                resolved_name = self._resolve_call(call.name, function, module)
+                resolve_cache[key] = resolved_name
             call.resolved_name = resolved_name  # Add this field to FunctionCallElement
     
     def _extract_function_calls(self, function: FunctionElement, module: ModuleElement) -> List[FunctionCallElement]:
         """Extract function calls from a function's AST body.
-    
+
         Args:
             function: The FunctionElement containing the function's AST body
-        
+
         Returns:
             List of FunctionCallElement representing all function calls
         """
         visitor = PythonFunctionCallVisitor(module.imports_mapping)
-        # Visit all nodes in function body
+        # Walk the AST node saved at parse time instead of re-tokenizing and
+        # re-parsing the function's source for every element.
+        if function.ast_node is not None:
+            # visit_function skips the decorator_list so this path stays
+            # call-for-call equivalent to the reparse fallback below.
+            visitor.visit_function(function.ast_node)
+            # Line numbers on the saved node are module-absolute; normalize
+            # them to be relative to the function start, matching the
+            # numbering the re-parse fallback below produces.
+            offset = function.start_line - 1
+            for call in visitor.calls:
+                call.line_number -= offset
+            # Extraction is the node's last consumer; free the subtree.
+            function.ast_node = None
+            return visitor.calls
+
+        # Fallback for elements built without an AST node (e.g. in tests).
+        if not module.body:
+            return []
         try:
             # Extract just the function's source by line numbers
-            module_lines = module.body.splitlines()
+            module_lines = module.get_body_lines()
             function_source = '\n'.join(module_lines[function.start_line-1:function.end_line])
-            
+
             # Parse and visit just the function source
-            function_tree = ast.parse(function_source)
+            function_tree = self._get_ast(function_source)
             visitor.visit(function_tree)
             return visitor.calls
-            
+
         except Exception as e:
+            # Lazy %s formatting: the message is only built if DEBUG is on.
+            self.logger.debug("Could not extract calls from %s: %s", function.name, e)
             return []
-        
+
+
+    def _get_ast(self, body: str) -> ast.AST:
+        """Memoized ast.parse for the fallback path above."""
+        key = hashlib.sha256(body.encode('utf-8')).digest()
+        tree = self._ast_cache.get(key)
+        if tree is None:
+            tree = ast.parse(body)
+            self._ast_cache[key] = tree
+        return tree
 
     def _resolve_call(self, function_name: str, function: FunctionElement, module: ModuleElement) -> Optional[str]:
-        
+        # Locals carry PEP 526 annotations so Cython pure-python mode can
+        # type them as C-level strings (see setup.py); plain CPython ignores them.
+        module_part: str
+        func_part: str
+        local_name: str
+        imported_module_name: str
+        imported_name: str
+
         if '.' in function_name:
             module_part, func_part = function_name.split('.', 1)
             # Check if the module part is in imports_mapping (handles case: from A import B, then B.F)
             if module_part in module.imports_mapping:
                 base_module = module.imports_mapping[module_part]
-                return f"{base_module}.{func_part}"
+                return base_module + "." + func_part
             return function_name  # Return as-is for direct module imports (import A, then A.B)
 
         # 2. Check if the function is a built-in function
-        if self._is_builtin_function(function_name):
+        if function_name in _BUILTINS:
             return function_name  # Indicate that it's a built-in function
-        
-        # 2. Check local scope (within the same module)
-        local_name = f"{module.name}.{function_name}"
-        if local_name in self.symbol_table:
+
+        symbol_table = self.symbol_table
+
+        # 2. Check local scope (within the same module); a single dict get
+        # combines the membership test and the fetch.
+        local_prefix = self._local_prefixes.get(module.name) or module.name + "."
+        local_name = sys.intern(local_prefix + function_name)
+        if symbol_table.get(local_name) is not None:
             return local_name
-        
+
         # 3. Check imports mapping
-        if function_name in module.imports_mapping:
-            imported_module_name = module.imports_mapping[function_name]
-            imported_name = f"{imported_module_name}.{function_name}"
-            if imported_name in self.symbol_table:
+        imported_module_name = module.imports_mapping.get(function_name)
+        if imported_module_name is not None:
+            imported_name = imported_module_name + "." + function_name
+            if symbol_table.get(imported_name) is not None:
                 return imported_name
-        
+
         # 4. Check global symbol table
-        if function_name in self.symbol_table:
+        if function_name in symbol_table:
             return function_name  # Fully qualified name matches
-        
+
         # 5. Unable to resolve
         return None
     
     def _is_builtin_function(self, function_name: str) -> bool:
         # Use Python's built-in function list or a predefined set
-        return function_name in self._builtin_functions_set
\ No newline at end of file
+        return function_name in _BUILTINS
\ No newline at end of file
@@ -4,8 +4,9 @@ Base parser interface for all language-specific parsers.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import logging
+import os
 
 from ..models.data_models import (
     ModuleElement, ClassElement, FunctionElement, DocumentationElement
@@ -41,15 +42,36 @@ class BaseParser(ABC):
             List of ModuleElements for each parsed file
         """
         modules = []
-        for file_path in path.rglob('*'):
-            if file_path.is_file() and self.can_parse(file_path):
-                try:
-                    module = self.parse_file(file_path)
-                    modules.append(module)
-                except Exception as e:
-                    self.logger.error(f"Error parsing {file_path}: {e}")
+        for file_path in self._iter_candidate_files(path):
+            try:
+                module = self.parse_file(file_path)
+                modules.append(module)
+            except Exception as e:
+                self.logger.error(f"Error parsing {file_path}: {e}")
         return modules
 
+    def _iter_candidate_files(self, path: Path) -> Iterator[Path]:
+        """
+        Yield the files under path that this parser can handle.
+
+        Filters by supported extension during an os.walk rather than
+        rglob'ing every file and filtering afterwards, so non-matching files
+        (binaries, assets, generated output) are never wrapped in Path
+        objects or passed through can_parse.
+        """
+        extensions = tuple(self.get_supported_extensions())
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+            for file_name in files:
+                if extensions:
+                    if file_name.lower().endswith(extensions):
+                        yield Path(os.path.join(root, file_name))
+                else:
+                    # Parsers that declare no extensions fall back to can_parse.
+                    file_path = Path(os.path.join(root, file_name))
+                    if self.can_parse(file_path):
+                        yield file_path
+
     @abstractmethod
     def can_parse(self, path: Path) -> bool:
         """
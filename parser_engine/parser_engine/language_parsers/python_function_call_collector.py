@@ -18,17 +18,27 @@ class FunctionCallCollector(ast.NodeVisitor):
         self.generic_visit(node)
 
     def _get_function_name(self, node):
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            value = self._get_function_name(node.value)
-            if value:
-                return f"{value}.{node.attr}"
-        return None
+        # Iterative walk down the attribute chain; linear total work instead
+        # of a recursive frame and string concat per level. The annotations
+        # let Cython pure-python mode (see setup.py) type the loop locals;
+        # plain CPython ignores them.
+        parts: list = []
+        cur = node
+        while isinstance(cur, ast.Attribute):
+            parts.append(cur.attr)
+            cur = cur.value
+        if not isinstance(cur, ast.Name):
+            return None
+        parts.append(cur.id)
+        parts.reverse()
+        return ".".join(parts)
 
     def _resolve_module(self, function_name):
-        parts = function_name.split('.')
-        first_part = parts[0]
+        # Only the head of the dotted chain matters; slice it out instead of
+        # splitting the whole name into a throwaway list.
+        dot: int = function_name.find('.')
+        first_part: str
+        first_part = function_name if dot < 0 else function_name[:dot]
         if first_part in self.imports_mapping:
             return self.imports_mapping[first_part]
         else:
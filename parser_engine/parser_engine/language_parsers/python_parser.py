@@ -3,6 +3,15 @@ Python-specific code parser implementation.
 """
 
 import ast
+import builtins
+import hashlib
+import logging
+from inspect import cleandoc as _cleandoc
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
 from dataclasses import dataclass
@@ -11,8 +20,219 @@ from .base_parser import BaseParser
 from ..models.data_models import (
     ModuleElement, ClassElement, FunctionElement, DocumentationElement, FunctionCallElement
 )
+from ..utils.module_cache import PARSER_VERSION
 
-@dataclass
+# Files above this size are almost always generated or vendored; parsing them
+# costs far more than the information is worth.
+_MAX_SOURCE_BYTES = 2_000_000
+
+# Calling compile() directly skips the ast.parse wrapper and its argument
+# re-dispatch. PyCF_OPTIMIZED_AST (3.13+) additionally hands back the
+# constant-folded tree the interpreter would build anyway — fewer nodes for
+# every walk downstream; on older runtimes getattr degrades to plain parsing.
+_AST_COMPILE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, 'PyCF_OPTIMIZED_AST', 0)
+
+# Builtin names for the call visitor's fallback. frozenset(dir(builtins)) is
+# stable whether __builtins__ is a module or a dict in the importing context
+# (the bare `in __builtins__` test it replaces was not).
+_BUILTINS: frozenset = frozenset(dir(builtins))
+
+# Single-pass path<->module separators via translate, instead of chained
+# str.replace calls that each rescan the whole string.
+_PATH_TO_MOD = str.maketrans({'/': '.', '\\': '.'})
+_MOD_TO_PATH = str.maketrans({'.': '/'})
+
+# ast node classes are never subclassed here, so `type(x) is _Cls` identity
+# checks replace MRO-walking isinstance in the hot dispatch paths.
+_Name = ast.Name
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Constant = ast.Constant
+_ClassDef = ast.ClassDef
+_FunctionDef = ast.FunctionDef
+_AsyncFunctionDef = ast.AsyncFunctionDef
+_Expr = ast.Expr
+_Import = ast.Import
+_ImportFrom = ast.ImportFrom
+_Assign = ast.Assign
+_Subscript = ast.Subscript
+_Tuple = ast.Tuple
+_List = ast.List
+_Dict = ast.Dict
+_Set = ast.Set
+
+# ast.unparse re-walks the node and rebuilds a string every call, but the
+# same annotations (str, Optional[int], List[Foo]) repeat constantly across
+# a repo. Memoize on the canonical ast.dump form.
+_UNPARSE_CACHE: Dict[str, str] = {}
+
+def _cached_unparse(node: ast.AST) -> str:
+    """ast.unparse with fast paths for trivial nodes and a dump-keyed memo."""
+    node_type = type(node)
+    if node_type is _Name:
+        return node.id
+    if node_type is _Constant:
+        return repr(node.value)
+    key = ast.dump(node, annotate_fields=False)
+    unparsed = _UNPARSE_CACHE.get(key)
+    if unparsed is None:
+        unparsed = ast.unparse(node)
+        _UNPARSE_CACHE[key] = unparsed
+    return unparsed
+
+def _intern_short(s: str) -> str:
+    """sys.intern for strings that repeat across a repo.
+
+    Interned entries live for the whole process, so long assembled names
+    (full signatures, deep generics) are passed through untouched; type
+    names, import aliases and module names are short and recur constantly.
+    """
+    return sys.intern(s) if len(s) < 80 else s
+
+def _unparse_or_error(node: ast.AST) -> str:
+    """_cached_unparse fallback with the error handling the fast paths skip."""
+    try:
+        return _cached_unparse(node)
+    except Exception as e:
+        logging.getLogger("PythonParser").warning(f"Error parsing decorator: {e}")
+        return "<error_parsing_decorator>"
+
+def _render_decorator(decorator: ast.AST) -> str:
+    """Render one decorator node to its '@...' display string.
+
+    The Name/Constant fast paths cannot fail, so only the unparse fallback
+    carries a try/except — no handler setup on the common forms.
+    """
+    decorator_type = type(decorator)
+    if decorator_type is _Call:
+        # Decorators with arguments: @decorator(arg1, arg2)
+        func = decorator.func
+        parts = []
+        while type(func) is _Attribute:
+            parts.append(func.attr)
+            func = func.value
+        if type(func) is _Name:
+            parts.append(func.id)
+            parts.reverse()
+            decorator_name = ".".join(parts)
+        else:
+            decorator_name = _unparse_or_error(decorator.func)
+        args = []
+
+        # Process positional arguments
+        for arg in decorator.args:
+            arg_type = type(arg)
+            if arg_type is _Constant:
+                args.append(repr(arg.value))
+            elif arg_type is _Name:
+                args.append(arg.id)
+            else:
+                args.append(_unparse_or_error(arg))
+
+        # Process keyword arguments
+        for keyword in decorator.keywords:
+            if type(keyword.value) is _Constant:
+                args.append(f"{keyword.arg}={repr(keyword.value.value)}")
+            else:
+                args.append(f"{keyword.arg}={_unparse_or_error(keyword.value)}")
+
+        return f"@{decorator_name}({', '.join(args)})"
+
+    if decorator_type is _Name:
+        # Simple decorators: @decorator
+        return f"@{decorator.id}"
+
+    # Attribute decorators (@module.decorator) and anything else.
+    return f"@{_unparse_or_error(decorator)}"
+
+class _LazyDecorator:
+    """A decorator that renders its display string on first use.
+
+    Most parsed decorators are never shown, so the unparse/format work is
+    deferred until something actually treats the entry as a string. Equality
+    and hashing go through the rendered form, keeping existing comparisons
+    against plain strings (and round-trips through the pickle caches) intact.
+    """
+
+    __slots__ = ('node', '_rendered')
+
+    def __init__(self, node: ast.AST):
+        self.node = node
+        self._rendered = None
+
+    def __str__(self) -> str:
+        rendered = self._rendered
+        if rendered is None:
+            rendered = _render_decorator(self.node)
+            self._rendered = rendered
+        return rendered
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_LazyDecorator, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+# Batches below this size are parsed in-process; pool startup would cost
+# more than the work saved (same threshold as detect_languages).
+_PARALLEL_MIN_FILES = 32
+
+# Parser reused across calls within one worker process; rebuilt if a batch
+# arrives with a different cache directory.
+_pool_parser = None
+_pool_cache_dir = None
+
+def _parse_one(path_str: str, repo_root_str: str, cache_dir_str: str) -> ModuleElement:
+    """Parse a single file in a worker process (module-level so it pickles)."""
+    global _pool_parser, _pool_cache_dir
+    if _pool_parser is None or _pool_cache_dir != cache_dir_str:
+        _pool_parser = PythonParser(
+            cache_dir=Path(cache_dir_str) if cache_dir_str else None)
+        _pool_cache_dir = cache_dir_str
+    path = Path(path_str)
+    try:
+        module = _pool_parser.parse_file(
+            path, repo_root=Path(repo_root_str) if repo_root_str else None)
+        # Call extraction is a CPU-bound AST walk that only needs this
+        # module, so do it here and parallelize it with the parse instead
+        # of leaving it to the serial indexing phase.
+        _extract_module_calls(module)
+        return module
+    except Exception as e:
+        # Last-resort guard: parse_file only handles I/O and parse errors
+        # itself, and one bad file must not take down the whole pool batch.
+        return _pool_parser._create_error_module(path, e)
+
+def _extract_module_calls(module: ModuleElement) -> None:
+    """Populate function_calls for every function and method of a module."""
+    mapping = module.imports_mapping
+    functions = list(module.functions)
+    for cls in module.classes:
+        functions.extend(cls.methods)
+    for func in functions:
+        node = func.ast_node
+        if node is None:
+            continue
+        visitor = PythonFunctionCallVisitor(mapping)
+        visitor.visit_function(node)
+        # Saved nodes carry module-absolute line numbers; make them
+        # relative to the function start, as the indexer expects.
+        offset = func.start_line - 1
+        if offset:
+            for call in visitor.calls:
+                call.line_number -= offset
+        func.function_calls = visitor.calls
+        # The node has served its purpose; dropping it here keeps the
+        # whole AST out of the pickle sent back to the parent process
+        # and out of the long-lived module list.
+        func.ast_node = None
+
+@dataclass(slots=True)
 class ContextInfo:
     """Helper class to track parsing context."""
     module: Optional[ModuleElement] = None
@@ -20,21 +240,48 @@ class ContextInfo:
     parent_function: Optional[FunctionElement] = None
     in_async_def: bool = False
 
+# Node types that contribute one branch each to cyclomatic complexity.
+_BRANCH_TYPES = frozenset({
+    ast.If, ast.While, ast.For, ast.AsyncFor,
+    ast.ExceptHandler, ast.With, ast.AsyncWith,
+})
+_BoolOp = ast.BoolOp
+
 class PythonParser(BaseParser):
     """Parser for Python source code files."""
-    
+
     language = 'Python'
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Optional directory for the content-hash module cache.
+                When set, parse_file stores each ModuleElement keyed by
+                SHA-256 of (path, package, Python version, file bytes), so a
+                byte-identical file skips ast.parse entirely on later runs.
+        """
         super().__init__()
+        self.cache_dir = cache_dir
+        self.repo_root = None
+        # Dotted names of everything under repo_root, built by one walk on
+        # first use; _is_local_module is then a set membership test.
+        self._local_modules: Optional[frozenset] = None
 
-    def can_parse(self, path: Path) -> bool:
+    # Frozen at class scope; can_parse runs once per candidate file.
+    _SUPPORTED_EXTS = frozenset({'.py', '.pyw'})
+
+    def can_parse(self, path: Union[str, Path]) -> bool:
         """Check if file is a Python file."""
-        return path.suffix.lower() in self.get_supported_extensions()
+        # Plain string slicing instead of Path.suffix: the property walks
+        # the parsed path parts and this is called for every file found.
+        # dot > 0 matches pathlib, where dotfiles have no suffix.
+        name = os.path.basename(os.fspath(path))
+        dot = name.rfind('.')
+        return dot > 0 and name[dot:].lower() in self._SUPPORTED_EXTS
 
     def get_supported_extensions(self) -> List[str]:
         """Get supported Python file extensions."""
-        return ['.py', '.pyw']
+        return list(self._SUPPORTED_EXTS)
 
     def parse_file(self, path: Path, package_name = "", repo_root: Optional[Path] = None) -> ModuleElement:
         """
@@ -48,67 +295,179 @@ class PythonParser(BaseParser):
         Returns:
             ModuleElement containing the parsed information
         """
-        self.repo_root = repo_root
+        if repo_root != self.repo_root:
+            self.repo_root = repo_root
+            self._local_modules = None
+        # Only file I/O and the parse itself can realistically fail, so only
+        # they carry handlers; the element assembly below runs with no
+        # exception setup per call (pool workers add their own last-resort
+        # guard in _parse_one).
+        try:
+            # Read raw bytes once and decode explicitly: one syscall batch,
+            # and a stray undecodable byte degrades to U+FFFD instead of
+            # aborting the whole file.
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            self.logger.error(f"Error parsing {path}: {e}")
+            return self._create_error_module(path, e)
+
+        if len(data) > _MAX_SOURCE_BYTES:
+            return self._create_error_module(
+                path, ValueError(f"file too large to parse ({len(data)} bytes)"))
+        if b'\x00' in data[:1024]:
+            return self._create_error_module(
+                path, ValueError("binary content in Python file"))
+
+        cache_key = None
+        if self.cache_dir is not None:
+            cache_key = self._content_cache_key(path, package_name, data)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        # The decoded str is needed anyway for module.body/body_lines, so
+        # parse the same object rather than handing ast.parse the raw
+        # bytes (which would trigger a second internal decode).
+        content = data.decode('utf-8', errors='replace')
+
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # Parse the AST
-            tree = ast.parse(content)
-            
-            # Convert path to module name
-            # Assuming path is absolute, find common project root
-            # You might want to pass this as a parameter or detect it
-            project_root = path.parent.parent  # Example: adjust based on your needs
-            
-            try:
-                relative_path = path.relative_to(project_root)
-                module_name = str(relative_path.parent / relative_path.stem)  # Include parent dirs
-                module_name = module_name.replace('/', '.').replace('\\', '.')
-                parent_module = str(relative_path.parent).replace('/', '.').replace('\\', '.')
-                if parent_module == '.':
-                    parent_module = ''
-            except ValueError:
-                # Fallback if path is not relative to project_root
-                module_name = path.stem
-                parent_module = ''
-            
-            if package_name:
-                module_name = f"{package_name}.{module_name}"
-            
-            module = ModuleElement(
-                name=module_name,  # Will look like 'package.subpackage.module'
-                path=path,
-                language=self.language,
-                classes=[],
-                functions=[],
-                imports=[],
-                imports_mapping=dict(),
-                documentation=None,
-                body=content
-            )
-            
-            # Create initial context
-            context = ContextInfo(module=module)
-            
-            # Extract module docstring
-            module.documentation = self._parse_docstring(tree)
-            # Parse all module elements
-            for node in ast.iter_child_nodes(tree):
-                if isinstance(node, ast.ClassDef):
-                    module.classes.append(self._parse_class(path, node, context, module_name))
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    module.functions.append(self._parse_function(path, node, context, module_name))
-                elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                    imports = self._parse_imports(node, parent_module)
-                    module.imports.extend(imports.keys())
-                    module.imports_mapping.update(imports)
-            return module
-            
-        except Exception as e:
+            tree = compile(content, str(path), 'exec',
+                           flags=_AST_COMPILE_FLAGS, dont_inherit=True)
+        except (SyntaxError, ValueError) as e:
             self.logger.error(f"Error parsing {path}: {e}")
             return self._create_error_module(path, e)
 
+        # Convert path to module name
+        # Assuming path is absolute, find common project root
+        # You might want to pass this as a parameter or detect it
+        # Pure string manipulation: relative_to/.parent/.stem would build
+        # and normalize several Path objects per file for what is two
+        # dirname calls and a slice.
+        p = os.fspath(path)
+        project_root = os.path.dirname(os.path.dirname(p))
+
+        if project_root and p.startswith(project_root + os.sep):
+            rel = p[len(project_root) + 1:]
+        elif not project_root:
+            rel = p  # relative path with fewer than two components
+        else:
+            rel = os.path.basename(p)  # fallback, mirrors the old ValueError arm
+
+        rel_dir = os.path.dirname(rel)
+        parent_module = rel_dir.translate(_PATH_TO_MOD) if rel_dir else ''
+        if rel.endswith('.py'):
+            rel = rel[:-3]
+        elif rel.endswith('.pyw'):
+            rel = rel[:-4]
+        else:
+            rel = os.path.splitext(rel)[0]
+        module_name = rel.translate(_PATH_TO_MOD)
+
+        if package_name:
+            module_name = f"{package_name}.{module_name}"
+        # The module name is re-embedded in every element name below and
+        # keys several indexer dicts; one shared object speeds those
+        # lookups to pointer compares.
+        module_name = _intern_short(module_name)
+
+        module = ModuleElement(
+            name=module_name,  # Will look like 'package.subpackage.module'
+            path=path,
+            language=self.language,
+            classes=[],
+            functions=[],
+            imports=[],
+            imports_mapping=dict(),
+            documentation=None,
+            body=content,
+            body_lines=content.splitlines(),
+            size_bytes=len(data)  # already read; no stat needed
+        )
+
+        # Create initial context
+        context = ContextInfo(module=module)
+
+        # Extract module docstring
+        module.documentation = self._parse_docstring(tree)
+        # Parse all module elements. Iterate tree.body directly:
+        # iter_child_nodes would walk every AST field through a
+        # generator when only the statement list matters here. The
+        # bound appends skip a LOAD_ATTR per top-level statement.
+        classes_append = module.classes.append
+        functions_append = module.functions.append
+        for node in tree.body:
+            node_type = type(node)
+            if node_type is _ClassDef:
+                classes_append(self._parse_class(path, node, context, module_name))
+            elif node_type is _FunctionDef or node_type is _AsyncFunctionDef:
+                functions_append(self._parse_function(path, node, context, module_name))
+            elif node_type is _Import or node_type is _ImportFrom:
+                imports = self._parse_imports(node, parent_module)
+                module.imports.extend(imports.keys())
+                module.imports_mapping.update(imports)
+
+        if cache_key is not None:
+            self._cache_put(cache_key, module)
+        return module
+
+    def parse_files(self, paths: List[Path], repo_root: Optional[Path] = None) -> List[ModuleElement]:
+        """
+        Parse a batch of Python files in parallel.
+
+        Each file is independent CPU-bound work, so the batch fans out to a
+        process pool (chunked to amortize IPC). Workers build their own
+        parser sharing this parser's cache directory; parse_file already
+        converts failures into error modules, so one bad file cannot take
+        down the pool. Results come back in input order.
+        """
+        path_strs = [str(p) for p in paths]
+        if not path_strs:
+            return []
+        repo_root_str = str(repo_root) if repo_root else ""
+        cache_dir_str = str(self.cache_dir) if self.cache_dir else ""
+        if len(path_strs) < _PARALLEL_MIN_FILES:
+            # Small batches skip the pool: _parse_one runs in-process with
+            # identical semantics, without paying executor startup.
+            return [_parse_one(p, repo_root_str, cache_dir_str) for p in path_strs]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(
+                _parse_one, path_strs,
+                repeat(repo_root_str), repeat(cache_dir_str), chunksize=16))
+
+    def _content_cache_key(self, path: Path, package_name: str, data: bytes) -> str:
+        """Hash everything the parsed module depends on: identity and content."""
+        h = hashlib.sha256()
+        h.update(str(path).encode('utf-8'))
+        h.update(b'\x00')
+        h.update(package_name.encode('utf-8'))
+        h.update(b'\x00')
+        h.update(sys.version.encode('utf-8'))
+        h.update(b'\x00')
+        h.update(str(PARSER_VERSION).encode('ascii'))
+        h.update(b'\x00')
+        h.update(data)
+        return h.hexdigest()
+
+    def _cache_get(self, cache_key: str) -> Optional[ModuleElement]:
+        try:
+            with open(self.cache_dir / (cache_key + ".pkl"), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Discarding unreadable AST cache entry {cache_key}: {e}")
+            return None
+
+    def _cache_put(self, cache_key: str, module: ModuleElement) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / (cache_key + ".pkl"), 'wb') as f:
+                pickle.dump(module, f, protocol=5)
+        except Exception as e:
+            self.logger.debug(f"Could not cache module {cache_key}: {e}")
+
     def _parse_class(self, path: Path, node: ast.ClassDef, context: ContextInfo, parent_name: str) -> ClassElement:
         """Parse a class definition."""
         # Build qualified name based on context
@@ -120,9 +479,9 @@ class PythonParser(BaseParser):
             path=path,
             documentation=None,
             methods=[],
-            base_classes=[],
+            base_classes=(),
             attributes=dict(),
-            decorators=[],
+            decorators=(),
             start_line=node.lineno,
             end_line=node.end_lineno,
             module=context.module
@@ -142,21 +501,26 @@ class PythonParser(BaseParser):
         
         # Parse methods and nested classes
         for body_node in node.body:
-            if isinstance(body_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            body_type = type(body_node)
+            if body_type is _FunctionDef or body_type is _AsyncFunctionDef:
                 class_element.methods.append(self._parse_function(path, body_node, class_context, class_element.name))
-            elif isinstance(body_node, ast.ClassDef):
+            elif body_type is _ClassDef:
                 class_element.inner_classes.append(self._parse_class(path, body_node, class_context, class_element.name))
-            elif isinstance(body_node, ast.Assign):
+            elif body_type is _Assign:
                 # Class attributes
                 for target in body_node.targets:
-                    if isinstance(target, ast.Name):
+                    if type(target) is _Name:
                         class_element.attributes[target.id] = self._get_attribute_type(body_node.value)
                         
-        class_element.base_classes = [self._get_name(base) for base in node.bases]
+        # Base-class names (Protocol, ABC, common bases) repeat across a
+        # repo; interned they share one object each.
+        class_element.base_classes = tuple(
+            _intern_short(self._get_name(base)) for base in node.bases
+        )
         
         return class_element
 
-    def _parse_decorators(self, node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]) -> List[str]:
+    def _parse_decorators(self, node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]) -> tuple:
         """
         Parse decorators from a class or function node.
         
@@ -164,75 +528,21 @@ class PythonParser(BaseParser):
             node: AST node for class or function
             
         Returns:
-            List of decorator strings
-        """
-        decorators = []
-        for decorator in node.decorator_list:
-            try:
-                if isinstance(decorator, ast.Call):
-                    # Handle decorators with arguments: @decorator(arg1, arg2)
-                    decorator_name = self._get_decorator_name(decorator.func)
-                    args = []
-                    
-                    # Process positional arguments
-                    for arg in decorator.args:
-                        if isinstance(arg, ast.Constant):
-                            args.append(repr(arg.value))
-                        elif isinstance(arg, ast.Name):
-                            args.append(arg.id)
-                        else:
-                            args.append(ast.unparse(arg))
-                    
-                    # Process keyword arguments
-                    for keyword in decorator.keywords:
-                        if isinstance(keyword.value, ast.Constant):
-                            args.append(f"{keyword.arg}={repr(keyword.value.value)}")
-                        else:
-                            args.append(f"{keyword.arg}={ast.unparse(keyword.value)}")
-                    
-                    decorators.append(f"@{decorator_name}({', '.join(args)})")
-                
-                elif isinstance(decorator, ast.Attribute):
-                    # Handle decorators with attributes: @module.decorator
-                    decorators.append(f"@{self._get_decorator_name(decorator)}")
-                
-                elif isinstance(decorator, ast.Name):
-                    # Handle simple decorators: @decorator
-                    decorators.append(f"@{decorator.id}")
-                
-                else:
-                    # Handle any other decorator forms
-                    decorators.append(f"@{ast.unparse(decorator)}")
-                    
-            except Exception as e:
-                self.logger.warning(f"Error parsing decorator: {e}")
-                decorators.append(f"@<error_parsing_decorator>")
-        
-        return decorators
-
-    def _get_decorator_name(self, node: Union[ast.Name, ast.Attribute]) -> str:
-        """
-        Get the full name of a decorator node.
-        
-        Args:
-            node: AST node representing the decorator name
-            
-        Returns:
-            Full decorator name as a string
+            Tuple of decorator strings (lazily rendered)
         """
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_decorator_name(node.value)}.{node.attr}"
-        return ast.unparse(node)
+        # String reconstruction (unparse, repr, joins) is deferred until a
+        # decorator is actually displayed or compared; parsing only wraps
+        # the nodes.
+        return tuple(_LazyDecorator(decorator) for decorator in node.decorator_list)
 
     def _parse_function(self, path: Path, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], context: ContextInfo, parent_name: str) -> FunctionElement:
         """Parse a function or method definition."""
-        # Get parameters and return type
-        params = []
-        for arg in node.args.args:
-            param_type = self._get_annotation_type(arg.annotation)
-            params.append(f"{arg.arg}: {param_type}")
+        # Get parameters and return type. Built once, stored as a tuple:
+        # exact-size allocation and no list over-allocation per element.
+        params = tuple(
+            f"{arg.arg}: {self._get_annotation_type(arg.annotation)}"
+            for arg in node.args.args
+        )
         return_type = self._get_annotation_type(node.returns)
         
         # Build simple name for symbol table lookup
@@ -249,20 +559,14 @@ class PythonParser(BaseParser):
             documentation=None,
             parameters=params,
             return_type=return_type,
-            decorators=[],
+            decorators=(),
             complexity=None,
             start_line=node.lineno,
             end_line=node.end_lineno,
-            is_async=isinstance(node, ast.AsyncFunctionDef),
-            qualified_name=".".join(full_qualified_name)  # Full name with signature
-        )
-        
-        # Create new context for function contents
-        function_context = ContextInfo(
-            module=context.module,
-            parent_class=context.parent_class,
-            parent_function=function_element,
-            in_async_def=isinstance(node, ast.AsyncFunctionDef)
+            length=node.end_lineno - node.lineno + 1,
+            is_async=type(node) is _AsyncFunctionDef,
+            qualified_name=".".join(full_qualified_name),  # Full name with signature
+            ast_node=node  # Keep the node so call extraction can skip re-parsing
         )
         
         # Get docstring and decorators
@@ -286,7 +590,7 @@ class PythonParser(BaseParser):
                 if parent_module and not name.startswith('.'):
                     if not name.startswith(top_level) and self._is_local_module(name):
                         name = f"{top_level}.{name}"
-                imports_mapping[asname] = name
+                imports_mapping[_intern_short(asname)] = _intern_short(name)
         elif isinstance(node, ast.ImportFrom):
             module = node.module or ''
             
@@ -306,7 +610,7 @@ class PythonParser(BaseParser):
                         name = alias.name
                         asname = alias.asname if alias.asname else name
                         full_name = f"{module}.{name}"
-                        imports_mapping[asname] = full_name
+                        imports_mapping[_intern_short(asname)] = _intern_short(full_name)
                     return imports_mapping
                 elif module.startswith(top_level + '.'):
                     # Case: from model_parallel.utils import split_tensor
@@ -320,93 +624,205 @@ class PythonParser(BaseParser):
                 name = alias.name
                 asname = alias.asname if alias.asname else name
                 full_name = f"{module}.{name}" if module else name
-                imports_mapping[asname] = full_name
+                imports_mapping[_intern_short(asname)] = _intern_short(full_name)
         
         return imports_mapping
 
     def _is_local_module(self, module_name: str) -> bool:
-        """Check if a module is local to the repository."""
+        """Check if a module is local to the repository.
+
+        The first call walks repo_root once and snapshots every dotted
+        module and directory name into a frozenset; each check is then a
+        membership test instead of up to three stat syscalls per imported
+        name per file.
+        """
         if not self.repo_root:
             return False
-            
-        # Convert module name to potential file paths
-        possible_paths = [
-            self.repo_root / module_name.replace('.', '/'),  # as directory
-            self.repo_root / f"{module_name.replace('.', '/')}.py",  # as file
-            self.repo_root / f"{module_name.replace('.', '/')}/__init__.py"  # as package
-        ]
-        
-        return any(path.exists() for path in possible_paths)
+        if self._local_modules is None:
+            self._local_modules = self._scan_local_modules()
+        return module_name in self._local_modules
+
+    def _scan_local_modules(self) -> frozenset:
+        """Collect dotted names of all directories and Python modules under repo_root."""
+        names = set()
+        root_str = os.fspath(self.repo_root)
+        prefix_len = len(root_str) + 1
+        for dirpath, dirnames, filenames in os.walk(root_str):
+            dirnames[:] = [
+                d for d in dirnames if not d.startswith('.') and d != '__pycache__'
+            ]
+            rel = dirpath[prefix_len:]
+            dotted = rel.translate(_PATH_TO_MOD) if rel else ''
+            dot_prefix = dotted + '.' if dotted else ''
+            if dotted:
+                names.add(dotted)
+            for file_name in filenames:
+                if file_name.endswith(('.py', '.pyw')):
+                    names.add(dot_prefix + file_name.rpartition('.')[0])
+        return frozenset(names)
 
     def _parse_docstring(self, node: ast.AST) -> Optional[DocumentationElement]:
         """Extract docstring from an AST node."""
-        docstring = ast.get_docstring(node)
-        if docstring:
-            return DocumentationElement(
-                content=docstring,
-                path=str(getattr(node, 'lineno', 0)),
-                line_number=getattr(node, 'lineno', 0),
-                type='docstring'
-            )
+        # Inlined ast.get_docstring: three type-identity checks decide the
+        # (common) no-docstring case without a function call, and cleandoc
+        # only runs on an actual hit.
+        body = getattr(node, 'body', None)
+        if body:
+            first = body[0]
+            if type(first) is _Expr:
+                value = first.value
+                if type(value) is _Constant and type(value.value) is str:
+                    return DocumentationElement(
+                        content=_cleandoc(value.value),
+                        path=str(getattr(node, 'lineno', 0)),
+                        line_number=getattr(node, 'lineno', 0),
+                        type='docstring'
+                    )
         return None
 
     def _calculate_complexity(self, node: ast.AST) -> int:
         """
         Calculate cyclomatic complexity of a function.
-        Very basic implementation - counts branches.
+        Very basic implementation - counts branches with a manual list
+        stack: no NodeVisitor method dispatch, no per-node generator from
+        iter_child_nodes, and list.pop/append instead of a deque.
+        Traversal order differs from ast.walk but counting is
+        order-independent.
         """
         complexity = 1  # Base complexity
-        
-        for child in ast.walk(node):
-            # Count branches
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor,
-                                ast.ExceptHandler, ast.With, ast.AsyncWith)):
+        branch_types = _BRANCH_TYPES
+        iter_fields = ast.iter_fields
+        AST = ast.AST
+        stack = [node]
+        pop = stack.pop
+        append = stack.append
+        while stack:
+            n = pop()
+            n_type = type(n)
+            if n_type in branch_types:
                 complexity += 1
-            # Count boolean operations
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-                
+            elif n_type is _BoolOp:
+                complexity += len(n.values) - 1
+            for _, value in iter_fields(n):
+                if type(value) is list:
+                    for item in value:
+                        if isinstance(item, AST):
+                            append(item)
+                elif isinstance(value, AST):
+                    append(value)
         return complexity
 
     def _get_annotation_type(self, node: Optional[ast.AST]) -> str:
-        """Convert annotation AST node to string representation."""
+        """Convert annotation AST node to string representation.
+
+        Name, Constant and one-level Subscript forms (int, 'Foo',
+        List[int], Dict[str, int]) cover nearly all annotations and are
+        synthesized directly; only genuinely nested types fall through to
+        the unparse cache. Output matches ast.unparse for these shapes.
+        """
         if node is None:
             return 'Any'
-        return ast.unparse(node)
+        node_type = type(node)
+        if node_type is _Name:
+            return sys.intern(node.id)
+        if node_type is _Constant:
+            return repr(node.value)
+        if node_type is _Subscript:
+            value = node.value
+            if type(value) is _Name:
+                slc = node.slice
+                slc_type = type(slc)
+                if slc_type is _Name:
+                    return _intern_short(f"{value.id}[{slc.id}]")
+                if slc_type is _Tuple and all(type(e) is _Name for e in slc.elts):
+                    return _intern_short(
+                        f"{value.id}[{', '.join(e.id for e in slc.elts)}]")
+        return _cached_unparse(node)
 
     def _get_attribute_type(self, node: ast.AST) -> str:
         """Get the type of a class attribute from its value."""
-        if isinstance(node, ast.Constant):
+        node_type = type(node)
+        if node_type is _Constant:
             return type(node.value).__name__
-        elif isinstance(node, ast.List):
+        elif node_type is _List:
             return 'List'
-        elif isinstance(node, ast.Dict):
+        elif node_type is _Dict:
             return 'Dict'
-        elif isinstance(node, ast.Set):
+        elif node_type is _Set:
             return 'Set'
         return 'Any'
 
     def _get_name(self, node: ast.AST) -> str:
-        """Convert AST name node to string."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        return ast.unparse(node)
-
-class PythonFunctionCallVisitor(ast.NodeVisitor):
+        """Convert AST name node to string (iteratively, linear in chain depth)."""
+        parts = []
+        cur = node
+        while type(cur) is _Attribute:
+            parts.append(cur.attr)
+            cur = cur.value
+        if type(cur) is _Name:
+            parts.append(cur.id)
+            parts.reverse()
+            return ".".join(parts)
+        return _cached_unparse(node)
+
+class PythonFunctionCallVisitor:
+    # Not a NodeVisitor subclass: visit() below owns the whole traversal,
+    # and without the dict-bearing base class __slots__ actually applies.
+    __slots__ = ('imports_mapping', 'calls', '_alias_last')
+
     def __init__(self, imports_mapping):
         self.imports_mapping = imports_mapping
         self.calls = []
-        self.current_scope = []  # Track nested function/class scopes
+        # last-segment-of-alias -> full path, so the fallback in
+        # _resolve_module is one dict probe instead of a scan of every
+        # import for every unresolved name.
+        self._alias_last = {
+            alias.rpartition('.')[2]: full
+            for alias, full in imports_mapping.items()
+        }
 
-    def visit_Call(self, node):
+    def visit(self, node):
+        # Explicit-stack pre-order walk instead of NodeVisitor's per-node
+        # method dispatch (a visit() call plus a generic_visit() frame per
+        # node). Children are pushed reversed so calls still come out in
+        # source order. Nested def/class bodies are walked on purpose:
+        # they are not separate elements here, so their calls belong to
+        # the enclosing function.
+        stack = [node]
+        pop = stack.pop
+        extend = stack.extend
+        iter_child_nodes = ast.iter_child_nodes
+        while stack:
+            node = pop()
+            if type(node) is _Call:
+                self._handle_call(node)
+            children = list(iter_child_nodes(node))
+            children.reverse()
+            extend(children)
+
+    def visit_function(self, node):
+        """Walk a function definition the way the slice-reparse fallback does.
+
+        The decorator_list is skipped deliberately: decorators sit above
+        the def line, so the reparse fallback (which slices the source
+        from start_line) never sees them, and walking them would emit
+        calls whose normalized line numbers land at or below zero.
+        Everything on or after the def line — argument defaults and
+        annotations, the return annotation, and the body — is visited.
+        """
+        self.visit(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def _handle_call(self, node):
         function_name = self._get_function_name(node.func)
         if function_name:
             # Handle fully qualified names (e.g., module.submodule.function)
             parts = function_name.split('.')
             module_name = self._resolve_module(parts[0])
-            
+
             # If it's a method call on an imported object
             if module_name and len(parts) > 1:
                 module_name = f"{module_name}.{'.'.join(parts[1:-1])}"
@@ -415,41 +831,35 @@ class PythonFunctionCallVisitor(ast.NodeVisitor):
                 module_name=module_name,
                 line_number=node.lineno
             ))
-        self.generic_visit(node)
 
     def _get_function_name(self, node):
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            value = self._get_function_name(node.value)
-            if value:
-                return f"{value}.{node.attr}"
-            # Handle cases where value might be a complex expression
-            return node.attr
-        return None
+        # Iterative walk down the attribute chain: one list + one join
+        # instead of a frame and a string concat per level.
+        parts = []
+        cur = node
+        while type(cur) is _Attribute:
+            parts.append(cur.attr)
+            cur = cur.value
+        if type(cur) is _Name:
+            parts.append(cur.id)
+        elif not parts:
+            return None
+        # For complex bases (calls, subscripts) keep the attribute tail.
+        parts.reverse()
+        return ".".join(parts)
 
     def _resolve_module(self, first_part):
         # Direct import mapping
-        if first_part in self.imports_mapping:
-            return self.imports_mapping[first_part]
-        
-        # Check for nested imports (from x import y as z)
-        for import_alias, full_path in self.imports_mapping.items():
-            if first_part == import_alias.split('.')[-1]:
-                return full_path
-                
-        # Could be built-in, local function, or class method
-        if first_part in __builtins__:
-            return 'builtins'
-        return None
+        full_path = self.imports_mapping.get(first_part)
+        if full_path is not None:
+            return full_path
 
-    # Track scope for better context
-    def visit_FunctionDef(self, node):
-        self.current_scope.append(node.name)
-        self.generic_visit(node)
-        self.current_scope.pop()
+        # Nested imports (from x import y as z), via the reverse index
+        full_path = self._alias_last.get(first_part)
+        if full_path is not None:
+            return full_path
 
-    def visit_ClassDef(self, node):
-        self.current_scope.append(node.name)
-        self.generic_visit(node)
-        self.current_scope.pop()
\ No newline at end of file
+        # Could be built-in, local function, or class method
+        if first_part in _BUILTINS:
+            return 'builtins'
+        return None
\ No newline at end of file
@@ -1,6 +1,7 @@
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from pathlib import Path
 
 """
@@ -67,7 +68,7 @@ class CommitData:
     lines_deleted: int
     branch: str = 'main'  # Add branch tracking
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentationElement:
     """Represents a documentation block."""
     content: str
@@ -81,7 +82,7 @@ class DocumentationElement:
         """Check if this is a docstring."""
         return self.type == 'docstring'
 
-@dataclass
+@dataclass(slots=True)  # Slot-backed: no per-instance __dict__ for the hottest objects
 class FunctionCallElement:
     """Represents a function call."""
     name: str
@@ -89,7 +90,7 @@ class FunctionCallElement:
     line_number: int
     resolved_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class FunctionElement:
     """Represents a function or method."""
     # The function's own name should be in format of 
@@ -102,20 +103,35 @@ class FunctionElement:
     end_line: int  # Add end line tracking
     module: Optional['ModuleElement'] = None
     documentation: Optional[DocumentationElement] = None
-    parameters: List[str] = field(default_factory=list)
+    # Populated once at parse time and never mutated; tuples carry no
+    # over-allocation and are smaller than lists per instance.
+    parameters: Tuple[str, ...] = ()
     return_type: Optional[str] = None
-    decorators: List[str] = field(default_factory=list)
+    decorators: Tuple = ()
     complexity: Optional[int] = None
+    # Line count, computed once at construction; was a property that read
+    # the nonexistent self.line_number and raised on every access.
+    length: int = 0
     is_async: bool = False
     function_calls: List['FunctionCallElement'] = field(default_factory=list)
     qualified_name: Optional[str] = None
-    
+    ast_node: Optional[Any] = None  # ast.FunctionDef/AsyncFunctionDef from the original parse
+    # Resolved calls grouped by 0-based line offset, precomputed during indexing.
+    calls_by_line: Dict[int, List['FunctionCallElement']] = field(default_factory=dict)
+
     @property
-    def length(self) -> int:
-        """Calculate function length in lines."""
-        return self.end_line - self.line_number + 1
+    def unique_calls(self) -> List['FunctionCallElement']:
+        """Function calls deduplicated by resolved (or raw) name, in order."""
+        seen = set()
+        unique = []
+        for call in self.function_calls:
+            key = call.resolved_name or call.name
+            if key not in seen:
+                seen.add(key)
+                unique.append(call)
+        return unique
 
-@dataclass
+@dataclass(slots=True)
 class ClassElement:
     """Represents a class definition."""
     # The class's own name should be in format of 
@@ -129,13 +145,15 @@ class ClassElement:
     module: Optional['ModuleElement'] = None
     documentation: Optional[DocumentationElement] = None
     methods: List[FunctionElement] = field(default_factory=list)
-    base_classes: List[str] = field(default_factory=list)
+    # base_classes/decorators are assigned whole at parse time; see
+    # FunctionElement for the tuple rationale.
+    base_classes: Tuple[str, ...] = ()
     attributes: Dict[str, str] = field(default_factory=dict)
-    decorators: List[str] = field(default_factory=list)
+    decorators: Tuple = ()
     inner_classes: List['ClassElement'] = field(default_factory=list)  # Add inner classes support
     qualified_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ModuleElement:
     """Represents a code module (file)."""
     # The module's own name should be in format of
@@ -153,14 +171,21 @@ class ModuleElement:
     lines_of_code: int = 0
     error: Optional[str] = None
     body: Optional[str] = None
+    body_lines: Optional[List[str]] = None
     imports_mapping: Dict[str, str] = field(default_factory=dict)
-    
+
+    def get_body_lines(self) -> List[str]:
+        """Return the module body split into lines, splitting at most once."""
+        if self.body_lines is None:
+            self.body_lines = self.body.splitlines() if self.body else []
+        return self.body_lines
+
     @property
     def is_package(self) -> bool:
         """Check if this module is a package (__init__.py)."""
         return self.name == '__init__'
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCallElement:
     """Represents a function call."""
     name: str
@@ -168,7 +193,7 @@ class FunctionCallElement:
     line_number: int
     resolved_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class FileNode:
     """Represents a file in the repository."""
     name: str
@@ -191,7 +216,7 @@ class FileNode:
         """Check if this is a documentation file."""
         return self.content_type == 'documentation'
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryNode:
     """Represents a directory in the repository."""
     name: str
@@ -210,6 +235,17 @@ class DirectoryNode:
         if not self.last_modified or file.last_modified > self.last_modified:
             self.last_modified = file.last_modified
     
+    def add_files(self, files: List[FileNode]) -> None:
+        """Add a batch of files, updating the aggregate statistics once."""
+        if not files:
+            return
+        self.files.extend(files)
+        self.total_files += len(files)
+        self.total_size_bytes += sum(f.size_bytes for f in files)
+        newest = max(f.last_modified for f in files)
+        if not self.last_modified or newest > self.last_modified:
+            self.last_modified = newest
+
     def add_directory(self, directory: 'DirectoryNode') -> None:
         """Add a subdirectory and update statistics."""
         self.subdirectories.append(directory)
@@ -236,7 +272,16 @@ class DirectoryTree:
     language_stats: Dict[str, int] = field(default_factory=dict)  # language -> lines of code
     
     def calculate_stats(self) -> Dict[str, Union[int, Dict[str, int]]]:
-        """Calculate and return repository statistics."""
+        """Calculate and return repository statistics.
+
+        Counters are reset first, so repeated calls recompute instead of
+        double-counting into the previous totals.
+        """
+        self.total_files = 0
+        self.total_size_bytes = 0
+        self.max_depth = 0
+        self.file_types = Counter()
+        self.language_stats = Counter()
         self._calculate_stats_recursive(self.root, 0)
         return {
             'total_files': self.total_files,
@@ -248,17 +293,21 @@ class DirectoryTree:
     
     def _calculate_stats_recursive(self, node: DirectoryNode, depth: int) -> None:
         """Recursively calculate statistics for the directory tree."""
-        self.max_depth = max(self.max_depth, depth)
-        
-        for file in node.files:
-            self.total_files += 1
-            self.total_size_bytes += file.size_bytes
-            self.file_types[file.extension] = self.file_types.get(file.extension, 0) + 1
-            if file.language:
-                self.language_stats[file.language] = (
-                    self.language_stats.get(file.language, 0) + file.lines_of_code
-                )
-        
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+        files = node.files
+        if files:
+            self.total_files += len(files)
+            self.total_size_bytes += sum(f.size_bytes for f in files)
+            # Counter.update aggregates the batch in C instead of a
+            # dict.get/store pair per file.
+            self.file_types.update(f.extension for f in files)
+            language_stats = self.language_stats
+            for f in files:
+                if f.language:
+                    language_stats[f.language] += f.lines_of_code
+
         for subdir in node.subdirectories:
             self._calculate_stats_recursive(subdir, depth + 1)
 
@@ -1,13 +1,16 @@
 from datetime import datetime
 from parser_engine.models.data_models import *
 
+# Fixed timestamp for every model below; nothing asserts against a real clock.
+_NOW = datetime(2024, 1, 1)
+
 def test_contributor_data():
     contributor = ContributorData(
         name="John Doe",
         email="john@example.com",
         commits_count=10,
-        first_commit_date=datetime.now(),
-        last_commit_date=datetime.now(),
+        first_commit_date=_NOW,
+        last_commit_date=_NOW,
         lines_added=100,
         lines_deleted=50
     )
@@ -51,7 +54,7 @@ def test_file_node():
         name="main.py",
         path="/src/main.py",
         size_bytes=1000,
-        last_modified=datetime.now(),
+        last_modified=_NOW,
         extension=".py",
         content_type="code",
         language="Python",
@@ -71,7 +74,7 @@ def test_directory_node():
         name="main.py",
         path="/src/main.py",
         size_bytes=1000,
-        last_modified=datetime.now(),
+        last_modified=_NOW,
         extension=".py",
         content_type="code"
     )
@@ -80,13 +83,12 @@ def test_directory_node():
         name="utils.py",
         path="/src/utils.py",
         size_bytes=500,
-        last_modified=datetime.now(),
+        last_modified=_NOW,
         extension=".py",
         content_type="code"
     )
     
-    directory.add_file(file1)
-    directory.add_file(file2)
+    directory.add_files([file1, file2])
     
     assert directory.total_files == 2
     assert directory.total_size_bytes == 1500
@@ -100,7 +102,7 @@ def test_directory_tree():
         name="main.py",
         path="/src/main.py",
         size_bytes=1000,
-        last_modified=datetime.now(),
+        last_modified=_NOW,
         extension=".py",
         content_type="code",
         language="Python",
@@ -111,7 +113,7 @@ def test_directory_tree():
         name="test_main.py",
         path="/tests/test_main.py",
         size_bytes=500,
-        last_modified=datetime.now(),
+        last_modified=_NOW,
         extension=".py",
         content_type="code",
         language="Python",
@@ -1,56 +1,72 @@
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from datetime import datetime
 
 from ..utils.file_classifier import FileClassifier
 
+@lru_cache(maxsize=None)
+def _fake_open(data):
+    """One cached mock_open per distinct content; calling it resets the IO state."""
+    return mock_open(read_data=data)
+
+# Path construction is surprisingly costly; build the fixtures once at import.
+_CODE_PATHS = tuple(
+    Path(f"/test/{n}") for n in
+    ("test.py", "main.cpp", "app.js", "index.html", "styles.css")
+)
+_DOC_PATHS = tuple(
+    Path(f"/test/{n}") for n in
+    ("README.md", "CONTRIBUTING.rst", "docs.txt", "api.wiki", "guide.adoc")
+)
+_CONFIG_PATHS = tuple(
+    Path(f"/test/{n}") for n in
+    ("config.json", "settings.yml", ".env", "setup.cfg", "webpack.config.js")
+)
+_SPECIAL_CASES = tuple(
+    (Path(f"/test/{n}"), expected) for n, expected in (
+        ("Dockerfile", "configuration"),
+        ("Makefile", "build"),
+        ("requirements.txt", "configuration"),
+        ("LICENSE", "documentation"),
+        (".gitignore", "configuration"),
+    )
+)
+_NESTED_CASES = tuple(
+    (Path(p), expected) for p, expected in (
+        ("src/main.py", "code"),
+        ("docs/api/reference.md", "documentation"),
+        ("config/prod/settings.json", "configuration"),
+        ("build/lib/binary.so", "binary"),
+    )
+)
+
+def _path_id(value):
+    """Readable parametrize ids: the file name for paths, default otherwise."""
+    return value.name if isinstance(value, Path) else None
+
 class TestFileClassifier:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def classifier(self):
+        # The classifier is only queried, never mutated, so one instance
+        # serves the whole module instead of one per test.
         return FileClassifier()
 
-    def test_classify_code_files(self, classifier):
+    @pytest.mark.parametrize("path", _CODE_PATHS, ids=_path_id)
+    def test_classify_code_files(self, classifier, path):
         """Test classification of code files"""
-        code_files = [
-            "test.py",
-            "main.cpp",
-            "app.js",
-            "index.html",
-            "styles.css"
-        ]
-        
-        for filename in code_files:
-            path = Path(f"/test/{filename}")
-            assert classifier.classify_file(path) == "code"
+        assert classifier.classify_file(path) == "code"
 
-    def test_classify_documentation_files(self, classifier):
+    @pytest.mark.parametrize("path", _DOC_PATHS, ids=_path_id)
+    def test_classify_documentation_files(self, classifier, path):
         """Test classification of documentation files"""
-        doc_files = [
-            "README.md",
-            "CONTRIBUTING.rst",
-            "docs.txt",
-            "api.wiki",
-            "guide.adoc"
-        ]
-        
-        for filename in doc_files:
-            path = Path(f"/test/{filename}")
-            assert classifier.classify_file(path) == "documentation"
+        assert classifier.classify_file(path) == "documentation"
 
-    def test_classify_configuration_files(self, classifier):
+    @pytest.mark.parametrize("path", _CONFIG_PATHS, ids=_path_id)
+    def test_classify_configuration_files(self, classifier, path):
         """Test classification of configuration files"""
-        config_files = [
-            "config.json",
-            "settings.yml",
-            ".env",
-            "setup.cfg",
-            "webpack.config.js"
-        ]
-        
-        for filename in config_files:
-            path = Path(f"/test/{filename}")
-            assert classifier.classify_file(path) == "configuration"
+        assert classifier.classify_file(path) == "configuration"
 
     @patch('mimetypes.guess_type')
     def test_binary_file_detection(self, mock_guess_type, classifier):
@@ -74,16 +90,14 @@ class TestFileClassifier:
             path = Path(filename)
             assert classifier.classify_file(path) == "ignored"
 
-    @patch('builtins.open', new_callable=mock_open, 
-           read_data='# Documentation\n## Overview\nThis is a guide.')
-    def test_documentation_content_detection(self, mock_file, classifier):
+    @patch('builtins.open', new=_fake_open('# Documentation\n## Overview\nThis is a guide.'))
+    def test_documentation_content_detection(self, classifier):
         """Test detection of documentation based on content"""
         path = Path("/test/guide")  # No extension
         assert classifier.classify_file(path) == "documentation"
 
-    @patch('builtins.open', new_callable=mock_open, 
-           read_data='[settings]\nkey=value')
-    def test_configuration_content_detection(self, mock_file, classifier):
+    @patch('builtins.open', new=_fake_open('[settings]\nkey=value'))
+    def test_configuration_content_detection(self, classifier):
         """Test detection of configuration based on content"""
         path = Path("/test/config")  # No extension
         assert classifier.classify_file(path) == "configuration"
@@ -99,19 +113,10 @@ class TestFileClassifier:
             path = Path("/test/restricted.txt")
             assert classifier.classify_file(path) == "other"
 
-    def test_special_cases(self, classifier):
+    @pytest.mark.parametrize("path,expected_type", _SPECIAL_CASES, ids=_path_id)
+    def test_special_cases(self, classifier, path, expected_type):
         """Test classification of special case files"""
-        special_cases = {
-            "Dockerfile": "configuration",
-            "Makefile": "build",
-            "requirements.txt": "configuration",
-            "LICENSE": "documentation",
-            ".gitignore": "configuration"
-        }
-        
-        for filename, expected_type in special_cases.items():
-            path = Path(f"/test/{filename}")
-            assert classifier.classify_file(path) == expected_type
+        assert classifier.classify_file(path) == expected_type
 
     @patch('builtins.open', side_effect=UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid'))
     def test_unicode_error_handling(self, mock_open, classifier):
@@ -119,18 +124,10 @@ class TestFileClassifier:
         path = Path("/test/binary.data")
         assert classifier.classify_file(path) == "binary"
 
-    def test_nested_paths(self, classifier):
+    @pytest.mark.parametrize("path,expected_type", _NESTED_CASES, ids=_path_id)
+    def test_nested_paths(self, classifier, path, expected_type):
         """Test classification of files in nested directories"""
-        test_paths = {
-            "src/main.py": "code",
-            "docs/api/reference.md": "documentation",
-            "config/prod/settings.json": "configuration",
-            "build/lib/binary.so": "binary"
-        }
-        
-        for path_str, expected_type in test_paths.items():
-            path = Path(path_str)
-            assert classifier.classify_file(path) == expected_type
+        assert classifier.classify_file(path) == expected_type
 
     @pytest.mark.parametrize("filename,expected_type", [
         ("test.unknown", "other"),
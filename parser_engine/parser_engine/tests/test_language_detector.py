@@ -1,4 +1,5 @@
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from datetime import datetime
@@ -6,130 +7,128 @@ from datetime import datetime
 from ..utils.language_detector import LanguageDetector
 from ..models.data_models import FileNode, DirectoryNode, DirectoryTree
 
+@lru_cache(maxsize=None)
+def _fake_open(data):
+    """One cached mock_open per distinct content; calling it resets the IO state."""
+    return mock_open(read_data=data)
+
+# One fixed timestamp shared by every mock FileNode; no test cares about the
+# value, so there is no reason to hit the clock.
+_NOW = datetime(2024, 1, 1)
+
+# Built once at import: the detector only reads the tree.
+_MOCK_TREE = DirectoryTree(root=DirectoryNode(
+    name="test_repo",
+    path=Path("/test_repo"),
+    files=[
+        FileNode(
+            name="main.py",
+            path=Path("/test_repo/main.py"),
+            size_bytes=100,
+            last_modified=_NOW,
+            extension=".py",
+            content_type="code"
+        ),
+        FileNode(
+            name="app.js",
+            path=Path("/test_repo/app.js"),
+            size_bytes=100,
+            last_modified=_NOW,
+            extension=".js",
+            content_type="code"
+        ),
+        FileNode(
+            name="CMakeLists.txt",
+            path=Path("/test_repo/CMakeLists.txt"),
+            size_bytes=100,
+            last_modified=_NOW,
+            extension=".txt",
+            content_type="build"
+        )
+    ]
+))
+
 class TestLanguageDetector:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def detector(self):
+        # Read-only in every test below; construct once per module.
         return LanguageDetector()
         
     @pytest.fixture
     def mock_directory_tree(self):
-        """Create a mock directory tree with various file types"""
-        root = DirectoryNode(
-            name="test_repo",
-            path=Path("/test_repo"),
-            files=[
-                FileNode(
-                    name="main.py",
-                    path=Path("/test_repo/main.py"),
-                    size_bytes=100,
-                    last_modified=datetime.now(),
-                    extension=".py",
-                    content_type="code"
-                ),
-                FileNode(
-                    name="app.js",
-                    path=Path("/test_repo/app.js"),
-                    size_bytes=100,
-                    last_modified=datetime.now(),
-                    extension=".js",
-                    content_type="code"
-                ),
-                FileNode(
-                    name="CMakeLists.txt",
-                    path=Path("/test_repo/CMakeLists.txt"),
-                    size_bytes=100,
-                    last_modified=datetime.now(),
-                    extension=".txt",
-                    content_type="build"
-                )
-            ]
-        )
-        return DirectoryTree(root=root)
+        """A mock directory tree with various file types (module constant)"""
+        return _MOCK_TREE
 
-    def test_detect_common_languages(self, detector):
+    @pytest.mark.parametrize("filename,expected_language", [
+        ("test.py", "Python"),
+        ("test.js", "JavaScript"),
+        ("test.java", "Java"),
+        ("test.cpp", "C++"),
+        ("test.rb", "Ruby"),
+        ("test.go", "Go")
+    ])
+    def test_detect_common_languages(self, detector, filename, expected_language):
         """Test detection of common programming languages"""
-        test_files = {
-            "test.py": "Python",
-            "test.js": "JavaScript",
-            "test.java": "Java",
-            "test.cpp": "C++",
-            "test.rb": "Ruby",
-            "test.go": "Go"
-        }
-        
-        for filename, expected_language in test_files.items():
-            file_node = FileNode(
-                name=filename,
-                path=Path(f"/test/{filename}"),
-                size_bytes=100,
-                last_modified=datetime.now(),
-                extension=Path(filename).suffix,
-                content_type="code"
-            )
-            assert detector._detect_language(file_node) == expected_language
+        file_node = FileNode(
+            name=filename,
+            path=Path(f"/test/{filename}"),
+            size_bytes=100,
+            last_modified=_NOW,
+            extension=Path(filename).suffix,
+            content_type="code"
+        )
+        assert detector._detect_language(file_node) == expected_language
 
-    def test_detect_build_systems(self, detector):
+    @pytest.mark.parametrize("filename,expected_system", [
+        ("Makefile", "Makefile"),
+        ("CMakeLists.txt", "CMake"),
+        ("build.gradle", "Gradle"),
+        ("pom.xml", "Maven"),
+        ("package.json", "NPM")
+    ])
+    def test_detect_build_systems(self, detector, filename, expected_system):
         """Test detection of build system files"""
-        test_files = {
-            "Makefile": "Makefile",
-            "CMakeLists.txt": "CMake",
-            "build.gradle": "Gradle",
-            "pom.xml": "Maven",
-            "package.json": "NPM"
-        }
-        
-        for filename, expected_system in test_files.items():
-            file_node = FileNode(
-                name=filename,
-                path=Path(f"/test/{filename}"),
-                size_bytes=100,
-                last_modified=datetime.now(),
-                extension=Path(filename).suffix,
-                content_type="build"
-            )
-            assert detector._detect_build_system(file_node) == expected_system
+        file_node = FileNode(
+            name=filename,
+            path=Path(f"/test/{filename}"),
+            size_bytes=100,
+            last_modified=_NOW,
+            extension=Path(filename).suffix,
+            content_type="build"
+        )
+        assert detector._detect_build_system(file_node) == expected_system
 
-    def test_count_code_lines_cpp(self, detector):
+    @pytest.mark.parametrize("source,expected", [
+        # Basic code without comments
+        ('int main() {\n    return 0;\n}', 3),
+        # Single-line comment
+        ('// Single line comment\nint main() {\n    return 0;\n}', 3),
+        # Multi-line comment
+        ('/* Multi-line\n comment */\nint main() {\n    return 0;\n}', 3),
+        # Python-style triple quotes in string literal
+        ('std::string s = """Python style quotes""";\nint main() {\n    return 0;\n}', 4),
+    ])
+    def test_count_code_lines_cpp(self, detector, source, expected):
         """Test counting of code lines in C++ with different comment styles"""
         file_path = Path("/test/test.cpp")
-        
-        # Test basic code without comments
-        with patch('builtins.open', new_callable=mock_open, 
-                  read_data='int main() {\n    return 0;\n}') as mock_file:
-            assert detector._count_code_lines(file_path, "C++") == 3
-            
-        # Test with single-line comment
-        with patch('builtins.open', new_callable=mock_open,
-                  read_data='// Single line comment\nint main() {\n    return 0;\n}') as mock_file:
-            assert detector._count_code_lines(file_path, "C++") == 3
-            
-        # Test with multi-line comment
-        with patch('builtins.open', new_callable=mock_open,
-                  read_data='/* Multi-line\n comment */\nint main() {\n    return 0;\n}') as mock_file:
-            assert detector._count_code_lines(file_path, "C++") == 3
-
-        # Test with Python-style triple quotes in string literal
-        with patch('builtins.open', new_callable=mock_open,
-                  read_data='std::string s = """Python style quotes""";\nint main() {\n    return 0;\n}') as mock_file:
-            assert detector._count_code_lines(file_path, "C++") == 4
+        with patch('builtins.open', new=_fake_open(source)):
+            assert detector._count_code_lines(file_path, "C++") == expected
 
-    def test_count_code_lines_python_comments(self, detector):
+    @pytest.mark.parametrize("source,expected", [
+        # Single-line comments
+        ('# Single line comment\ndef main():\n    return 0', 2),
+        # Multi-line comments
+        ('"""\nMulti-line\ndocstring\n"""\ndef main():\n    return 0', 2),
+    ])
+    def test_count_code_lines_python_comments(self, detector, source, expected):
         """Test counting of code lines with Python single-line and multi-line comments"""
         file_path = Path("/test/test.py")
-        
-        # Test single-line comments
-        with patch('builtins.open', new_callable=mock_open,
-                  read_data='# Single line comment\ndef main():\n    return 0') as mock_file:
-            assert detector._count_code_lines(file_path, "Python") == 2
-            
-        # Test multi-line comments
-        with patch('builtins.open', new_callable=mock_open,
-                  read_data='"""\nMulti-line\ndocstring\n"""\ndef main():\n    return 0') as mock_file:
-            assert detector._count_code_lines(file_path, "Python") == 2
+        with patch('builtins.open', new=_fake_open(source)):
+            assert detector._count_code_lines(file_path, "Python") == expected
 
-    @patch('builtins.open', new_callable=mock_open, 
-           read_data='#[[ Outer comment\n#[[ Nested comment ]]\nstill outer ]]\nadd_executable(main main.cpp)')
-    def test_count_code_lines_cmake_nested_comments(self, mock_file, detector):
+    @patch('builtins.open',
+           new=_fake_open('#[[ Outer comment\n#[[ Nested comment ]]\nstill outer ]]\nadd_executable(main main.cpp)'))
+    def test_count_code_lines_cmake_nested_comments(self, detector):
         """Test counting of code lines with CMake nested comments"""
         file_path = Path("/test/CMakeLists.txt")
         assert detector._count_code_lines(file_path, "CMake") == 1
@@ -146,9 +145,9 @@ class TestLanguageDetector:
             assert lang_stats["JavaScript"] == 10
             assert build_stats["CMake"] == 1
 
-    @patch('builtins.open', new_callable=mock_open, 
-           read_data='cmake_minimum_required(VERSION 3.10)\nproject(TestProject)')
-    def test_analyze_build_content(self, mock_file, detector):
+    @patch('builtins.open',
+           new=_fake_open('cmake_minimum_required(VERSION 3.10)\nproject(TestProject)'))
+    def test_analyze_build_content(self, detector):
         """Test analysis of build system content"""
         file_path = Path("/test/CMakeLists.txt")
         assert detector._analyze_build_content(file_path) == "CMake"
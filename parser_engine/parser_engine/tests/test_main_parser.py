@@ -1,60 +1,89 @@
 """
-Tests for the MainParserEngine.
+Tests for the MainParser.
 """
 
-import unittest
+import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
-from datetime import datetime
-
-from ..core.main_parser import MainParserEngine
-from ..models.data_models import (
-    RepositoryData, DirectoryTree, DirectoryNode, FileNode,
-    ModuleElement, DocumentationElement
-)
-
-class TestMainParserEngine(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary directory structure for testing
-        self.test_repo_path = Path("test_repo")
-        self.parser = MainParserEngine(str(self.test_repo_path))
-        
-        # Mock dependencies
-        self.parser._language_detector = Mock()
-        self.parser._file_classifier = Mock()
-        self.parser._metadata_extractor = Mock()
-        self.parser._documentation_parser = Mock()
-
-    def test_initialization(self):
+
+from ..core.main_parser import MainParser
+from ..models.data_models import DirectoryTree, ModuleElement
+
+class TestMainParser:
+    @pytest.fixture
+    def parser(self, tmp_path):
+        return MainParser(tmp_path)
+
+    def test_initialization(self, parser, tmp_path):
         """Test parser initialization."""
-        self.assertEqual(self.parser.repo_path, self.test_repo_path)
-        self.assertIsNotNone(self.parser.logger)
+        assert parser.repo_path == tmp_path
+        assert parser.logger is not None
+        assert parser.modules == []
+        assert parser.indexer is None
 
-    def test_invalid_repository_path(self):
-        """Test initialization with invalid repository path."""
-        with self.assertRaises(ValueError):
-            MainParserEngine("nonexistent_path")
+    def test_missing_repository_path(self, tmp_path):
+        """parse_repo rejects a repository path that does not exist."""
+        parser = MainParser(tmp_path / "nonexistent")
+        with pytest.raises(FileNotFoundError):
+            parser.parse_repo()
 
-    def test_parse_repository(self):
+    def test_parse_repo_and_call_graph(self, parser, tmp_path):
         """Test the complete repository parsing process."""
-        # Mock the component responses
-        self.parser._build_directory_tree = Mock(return_value=DirectoryTree(
-            root=DirectoryNode(name="test", path=self.test_repo_path)
-        ))
-        self.parser._detect_languages = Mock(return_value={"Python": 1000})
-        self.parser._parse_code_files = Mock(return_value=[])
-        self.parser._parse_documentation_files = Mock(return_value=[])
-        self.parser._extract_metadata = Mock(return_value=([], []))
-        
-        # Execute parsing
-        result = self.parser.parse_repository()
-        
-        # Verify result
-        self.assertIsInstance(result, RepositoryData)
-        self.assertEqual(result.name, self.test_repo_path.name)
-        self.assertEqual(result.primary_language, "Python")
-
-    # Add more test methods for other functionality...
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        (tmp_path / "app.py").write_text(
+            "def helper():\n"
+            "    return 1\n"
+            "\n"
+            "def main():\n"
+            "    return helper()\n"
+        )
+
+        parser.parse_repo()
+
+        assert len(parser.modules) == 1
+        assert isinstance(parser.modules[0], ModuleElement)
+        assert parser.indexer is not None
+
+        parser.build_call_graph()
+        # main() calls helper(), so at least one resolved edge must exist.
+        assert any(callees for callees in parser.call_graph.values())
+
+    def test_display_function_with_class_constructor_callee(self, parser, tmp_path, capsys):
+        """Displaying a function that instantiates a local class must not crash."""
+        (tmp_path / "app.py").write_text(
+            "class Widget:\n"
+            "    def __init__(self):\n"
+            "        self.size = 0\n"
+            "\n"
+            "def main():\n"
+            "    return Widget()\n"
+        )
+
+        parser.parse_repo()
+        parser.build_call_graph()
+        main_fqn = next(
+            name for name in parser.indexer.symbol_table if name.endswith(".main")
+        )
+
+        parser.display_function_source_and_calls(main_fqn)
+
+        output = capsys.readouterr().out
+        assert "return Widget()" in output
+        # The class callee renders terminally instead of being expanded.
+        assert "(class)" in output
+
+    def test_build_call_graph_requires_parse(self, parser):
+        """build_call_graph refuses to run before parse_repo."""
+        with pytest.raises(RuntimeError):
+            parser.build_call_graph()
+
+    def test_build_directory_tree(self, parser, tmp_path):
+        """Test directory tree construction and aggregate totals."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "b.py").write_text("y = 2\n")
+
+        tree = parser._build_directory_tree()
+
+        assert isinstance(tree, DirectoryTree)
+        assert tree.root.total_files == 2
+        assert tree.root.total_size_bytes > 0
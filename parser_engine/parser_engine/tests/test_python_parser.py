@@ -1,4 +1,6 @@
+import copy
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import Mock, patch
 import ast
@@ -7,9 +9,203 @@ from textwrap import dedent
 from ..language_parsers.python_parser import PythonParser, ContextInfo
 from ..models.data_models import ModuleElement, ClassElement, FunctionElement, DocumentationElement
 
+# The snippets below are deterministic, so parse them once at import time
+# instead of re-running the tokenizer and ast compiler in every test.
+_DOC_TREE = ast.parse(dedent('''
+    """Module docstring."""
+    def test():
+        """Function docstring."""
+        pass
+    '''))
+
+_FUNC_TREE = ast.parse(dedent('''
+    @decorator
+    async def test_func(param1: str, param2: int = 0) -> bool:
+        """Test function"""
+        if True:
+            return True
+        return False
+    '''))
+
+_CLASS_TREE = ast.parse(dedent('''
+    @decorator
+    class TestClass(BaseClass):
+        """Test class"""
+        class_attr = "test"
+
+        def method(self):
+            pass
+
+        class NestedClass:
+            pass
+    '''))
+
+@lru_cache(maxsize=None)
+def _parse(src):
+    """Parse-once cache for snippets shared across parametrized cases."""
+    return ast.parse(dedent(src))
+
+_COMPLEX_SRC = '''
+    def complex_func():
+        if True:
+            while True:
+                if False:
+                    pass
+                elif True:
+                    pass
+        try:
+            for i in range(10):
+                pass
+        except:
+            pass
+    '''
+
+_FILE_SRC = dedent('''
+    """Module docstring"""
+    from typing import List
+
+    class TestClass:
+        """Test class"""
+        def method(self):
+            pass
+
+    def test_func():
+        """Test function"""
+        pass
+    ''')
+
+_IMPORT_SOURCES = [
+    # Simple import
+    (
+        "import math",
+        "",
+        {"math": "math"}
+    ),
+    # Import with alias
+    (
+        "import math as m",
+        "",
+        {"m": "math"}
+    ),
+    # Multiple imports
+    (
+        "import os, sys as system",
+        "",
+        {"os": "os", "system": "sys"}
+    ),
+    # From import
+    (
+        "from os import path",
+        "",
+        {"path": "os.path"}
+    ),
+    # From import with alias
+    (
+        "from os import path as p",
+        "",
+        {"p": "os.path"}
+    ),
+    # Multiple from imports
+    (
+        "from os import path, getcwd as get_dir",
+        "",
+        {"path": "os.path", "get_dir": "os.getcwd"}
+    ),
+    # Relative imports
+    (
+        "from . import sibling",
+        "pkg.parent",
+        {"sibling": "pkg.parent.sibling"}
+    ),
+    (
+        "from .. import uncle",
+        "pkg.parent.child",
+        {"uncle": "pkg.uncle"}
+    ),
+    (
+        "from .cousin import func",
+        "pkg.parent",
+        {"func": "pkg.parent.cousin.func"}
+    ),
+    # Nested imports
+    (
+        "import pkg.subpkg.module",
+        "",
+        {"pkg": "pkg.subpkg.module"}
+    ),
+    # Import all
+    (
+        "from os import *",
+        "",
+        {"*": "os.*"}
+    ),
+    # Empty from import
+    (
+        "from . import module",
+        "pkg.parent",
+        {"module": "pkg.parent.module"}
+    ),
+
+    # Same function name from different modules with aliases
+    (
+        dedent('''
+            from os.path import basename as os_basename
+            from ntpath import basename as nt_basename
+        '''),
+        "",
+        {"os_basename": "os.path.basename", "nt_basename": "ntpath.basename"}
+    ),
+]
+
+# Pre-parsed once; a case may hold several import statements.
+_IMPORT_CASES = [
+    (src, ast.parse(src).body, parent, expected)
+    for src, parent, expected in _IMPORT_SOURCES
+]
+
+_LOCAL_IMPORT_SOURCES = [
+    # Local package imports
+    (
+        "from myproject.utils import helpers",
+        "myproject.core",
+        {"helpers": "myproject.utils.helpers"}
+    ),
+    # Relative imports within package
+    (
+        "from ..utils import helpers",
+        "myproject.core.submodule",
+        {"helpers": "myproject.utils.helpers"}
+    ),
+    # Import from sibling module
+    (
+        "from .utils import helpers",
+        "myproject",
+        {"helpers": "myproject.utils.helpers"}
+    ),
+    # Direct local package import
+    (
+        "import myproject.utils.helpers",
+        "",
+        {"myproject": "myproject.utils.helpers"}
+    ),
+    # Import with alias
+    (
+        "from myproject.utils.helpers import some_func as helper",
+        "myproject.core",
+        {"helper": "myproject.utils.helpers.some_func"}
+    ),
+]
+
+_LOCAL_IMPORT_CASES = [
+    (src, ast.parse(src).body[0], parent, expected)
+    for src, parent, expected in _LOCAL_IMPORT_SOURCES
+]
+
 class TestPythonParser:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
+        # Shared across the module; the one test that mutates parser state
+        # (test_parse_imports_with_local_modules) works on a shallow copy.
         return PythonParser()
 
     def test_initialization(self, parser):
@@ -32,30 +228,14 @@ class TestPythonParser:
 
     def test_parse_docstring(self, parser):
         """Test docstring parsing"""
-        code = '''
-        """Module docstring."""
-        def test():
-            """Function docstring."""
-            pass
-        '''
-        tree = ast.parse(dedent(code))
-        doc = parser._parse_docstring(tree)
+        doc = parser._parse_docstring(_DOC_TREE)
         assert isinstance(doc, DocumentationElement)
         assert doc.content == "Module docstring."
         assert doc.type == 'docstring'
 
     def test_parse_function(self, parser):
         """Test function parsing"""
-        code = '''
-        @decorator
-        async def test_func(param1: str, param2: int = 0) -> bool:
-            """Test function"""
-            if True:
-                return True
-            return False
-        '''
-        tree = ast.parse(dedent(code))
-        func_node = tree.body[0]
+        func_node = _FUNC_TREE.body[0]
         module = ModuleElement(name='test', path=Path('test.py'), language = 'Python')
         func = parser._parse_function(Path('test.py'), func_node, ContextInfo(module=module), str(module.name))
         
@@ -63,36 +243,23 @@ class TestPythonParser:
         assert func.name == 'test.test_func'
         assert func.qualified_name == 'test.test_func(param1: str, param2: int) -> bool'
         assert func.is_async
-        assert func.parameters == ['param1: str', 'param2: int']
+        assert func.parameters == ('param1: str', 'param2: int')
         assert func.return_type == 'bool'
-        assert func.decorators == ['@decorator']
+        assert func.decorators == ('@decorator',)
         assert func.complexity > 1  # Should count if statement
         assert isinstance(func.documentation, DocumentationElement)
         assert func.documentation.content == "Test function"
 
     def test_parse_class(self, parser):
         """Test class parsing"""
-        code = '''
-        @decorator
-        class TestClass(BaseClass):
-            """Test class"""
-            class_attr = "test"
-            
-            def method(self):
-                pass
-                
-            class NestedClass:
-                pass
-        '''
-        tree = ast.parse(dedent(code))
-        class_node = tree.body[0]
+        class_node = _CLASS_TREE.body[0]
         module = ModuleElement(name='test', path=Path('test.py'), language = 'Python')
         cls = parser._parse_class(Path('test.py'), class_node, ContextInfo(module=module), str(module.name))
         
         assert isinstance(cls, ClassElement)
         assert cls.name == 'test.TestClass'
-        assert cls.base_classes == ['BaseClass']
-        assert cls.decorators == ['@decorator']
+        assert cls.base_classes == ('BaseClass',)
+        assert cls.decorators == ('@decorator',)
         assert len(cls.methods) == 1
         assert cls.methods[0].name == 'test.TestClass.method'
         assert cls.methods[0].qualified_name == 'test.TestClass.method(self: Any) -> Any'
@@ -103,20 +270,7 @@ class TestPythonParser:
     def test_parse_file(self, parser, tmp_path):
         """Test complete file parsing"""
         test_file = tmp_path / "test.py"
-        code = '''
-        """Module docstring"""
-        from typing import List
-        
-        class TestClass:
-            """Test class"""
-            def method(self):
-                pass
-                
-        def test_func():
-            """Test function"""
-            pass
-        '''
-        test_file.write_text(dedent(code))
+        test_file.write_text(_FILE_SRC)
         
         module = parser.parse_file(test_file)
         
@@ -147,127 +301,39 @@ class TestPythonParser:
         assert not module.classes
         assert not module.functions
 
-    def test_complexity_calculation(self, parser):
+    @pytest.mark.parametrize("source,expected", [
+        # Straight-line code: base complexity only
+        ("def simple():\n    return 1\n", 1),
+        # One if plus one boolean operator
+        ("def guarded(a, b):\n    if a and b:\n        return a\n    return b\n", 3),
+        # Nested if/while/elif plus try/for/except
+        (_COMPLEX_SRC, 7),
+    ], ids=["simple", "guarded", "branch_heavy"])
+    def test_complexity_calculation(self, parser, source, expected):
         """Test cyclomatic complexity calculation"""
-        code = '''
-        def complex_func():
-            if True:
-                while True:
-                    if False:
-                        pass
-                    elif True:
-                        pass
-            try:
-                for i in range(10):
-                    pass
-            except:
-                pass
-        '''
-        tree = ast.parse(dedent(code))
-        func_node = tree.body[0]
-        complexity = parser._calculate_complexity(func_node)
-        assert complexity > 1  # Should count multiple branches
+        func_node = _parse(source).body[0]
+        assert parser._calculate_complexity(func_node) == expected
 
-    def test_parse_imports(self, parser):
+    @pytest.mark.parametrize(
+        "import_str,nodes,parent_module,expected",
+        _IMPORT_CASES,
+        ids=[case[0].strip() for case in _IMPORT_CASES]
+    )
+    def test_parse_imports(self, parser, import_str, nodes, parent_module, expected):
         """Test various import statement parsing scenarios"""
-        test_cases = [
-            # Simple import
-            (
-                "import math",
-                "",
-                {"math": "math"}
-            ),
-            # Import with alias
-            (
-                "import math as m",
-                "",
-                {"m": "math"}
-            ),
-            # Multiple imports
-            (
-                "import os, sys as system",
-                "",
-                {"os": "os", "system": "sys"}
-            ),
-            # From import
-            (
-                "from os import path",
-                "",
-                {"path": "os.path"}
-            ),
-            # From import with alias
-            (
-                "from os import path as p",
-                "",
-                {"p": "os.path"}
-            ),
-            # Multiple from imports
-            (
-                "from os import path, getcwd as get_dir",
-                "",
-                {"path": "os.path", "get_dir": "os.getcwd"}
-            ),
-            # Relative imports
-            (
-                "from . import sibling",
-                "pkg.parent",
-                {"sibling": "pkg.parent.sibling"}
-            ),
-            (
-                "from .. import uncle",
-                "pkg.parent.child",
-                {"uncle": "pkg.uncle"}
-            ),
-            (
-                "from .cousin import func",
-                "pkg.parent",
-                {"func": "pkg.parent.cousin.func"}
-            ),
-            # Nested imports
-            (
-                "import pkg.subpkg.module",
-                "",
-                {"pkg": "pkg.subpkg.module"}
-            ),
-            # Import all
-            (
-                "from os import *",
-                "",
-                {"*": "os.*"}
-            ),
-            # Empty from import
-            (
-                "from . import module",
-                "pkg.parent",
-                {"module": "pkg.parent.module"}
-            ),
-            
-            # Same function name from different modules with aliases
-            (
-                dedent('''
-                    from os.path import basename as os_basename
-                    from ntpath import basename as nt_basename
-                '''),
-                "",
-                {"os_basename": "os.path.basename", "nt_basename": "ntpath.basename"}
-            ),
-        ]
+        result = {}
+        # Process each import statement and merge results
+        for node in nodes:
+            result.update(parser._parse_imports(node, parent_module))
+        assert result == expected, f"Failed for import: {import_str}"
 
-        for import_str, parent_module, expected in test_cases:
-            # Parse all import statements in the string
-            nodes = ast.parse(import_str).body
-            result = {}
-            # Process each import statement and merge results
-            for node in nodes:
-                result.update(parser._parse_imports(node, parent_module))
-            assert result == expected, f"Failed for import: {import_str}"
-
-    def test_parse_imports_with_local_modules(self, parser, tmp_path):
-        """Test import parsing with local module resolution"""
-        # Setup mock repository structure
-        mock_project = tmp_path / "myproject"
+    @pytest.fixture(scope="module")
+    def local_parser(self, parser, tmp_path_factory):
+        """A parser rooted at a mock repository, built once per module."""
+        root = tmp_path_factory.mktemp("local_repo")
+        mock_project = root / "myproject"
         mock_project.mkdir()
-        
+
         # Create package structure
         (mock_project / "__init__.py").touch()
         (mock_project / "utils").mkdir()
@@ -275,43 +341,19 @@ class TestPythonParser:
         (mock_project / "utils/helpers.py").touch()
         (mock_project / "core").mkdir()
         (mock_project / "core/__init__.py").touch()
-        
-        parser.repo_root = tmp_path
 
-        test_cases = [
-            # Local package imports
-            (
-                "from myproject.utils import helpers",
-                "myproject.core",
-                {"helpers": "myproject.utils.helpers"}
-            ),
-            # Relative imports within package
-            (
-                "from ..utils import helpers",
-                "myproject.core.submodule",
-                {"helpers": "myproject.utils.helpers"}
-            ),
-            # Import from sibling module
-            (
-                "from .utils import helpers",
-                "myproject",
-                {"helpers": "myproject.utils.helpers"}
-            ),
-            # Direct local package import
-            (
-                "import myproject.utils.helpers",
-                "",
-                {"myproject": "myproject.utils.helpers"}
-            ),
-            # Import with alias
-            (
-                "from myproject.utils.helpers import some_func as helper",
-                "myproject.core",
-                {"helper": "myproject.utils.helpers.some_func"}
-            ),
-        ]
+        # Shallow copy so the shared parser fixture keeps no repo_root.
+        local = copy.copy(parser)
+        local.repo_root = root
+        local._local_modules = None
+        return local
 
-        for import_str, parent_module, expected in test_cases:
-            node = ast.parse(import_str).body[0]
-            result = parser._parse_imports(node, parent_module)
-            assert result == expected, f"Failed for import: {import_str}"
+    @pytest.mark.parametrize(
+        "import_str,node,parent_module,expected",
+        _LOCAL_IMPORT_CASES,
+        ids=[case[0] for case in _LOCAL_IMPORT_CASES]
+    )
+    def test_parse_imports_with_local_modules(self, local_parser, import_str, node, parent_module, expected):
+        """Test import parsing with local module resolution"""
+        result = local_parser._parse_imports(node, parent_module)
+        assert result == expected, f"Failed for import: {import_str}"
@@ -99,7 +99,7 @@ class TestRepoIndexer:
         assert indexer.modules == sample_modules
         assert isinstance(indexer.symbol_table, dict)
         assert isinstance(indexer.module_name_map, dict)
-        assert isinstance(indexer._builtin_functions_set, set)
+        assert isinstance(indexer._builtin_functions_set, frozenset)
 
     def test_build_module_name_map(self, sample_modules):
         indexer = RepoIndexer(sample_modules)
@@ -6,37 +6,61 @@ from pathlib import Path
 from typing import Set, Dict
 import logging
 import mimetypes
+import os
+import re
 
 class FileClassifier:
     """
     Classifies repository files into different categories based on extension and content.
     """
 
+    # Compiled once: one regex sweep over the sniffed head replaces a
+    # .lower() copy plus N substring scans per ambiguous file.
+    _DOC_RE = re.compile('|'.join(map(re.escape, (
+        '# documentation', '## overview', '# introduction',
+        '# guide', '# tutorial', '# readme'))), re.IGNORECASE)
+    _CFG_RE = re.compile('|'.join(map(re.escape, (
+        'config:', 'settings:', '[settings]', 'env ='))), re.IGNORECASE)
+
+    # Well-known names, hoisted so the per-file checks don't rebuild sets.
+    _DOC_FILENAMES = frozenset({'readme', 'contributing', 'changelog', 'license'})
+    _CONFIG_FILENAMES = frozenset({
+        'config', 'settings', '.env', 'dockerfile', 'makefile',
+        'requirements.txt', 'package.json', 'setup.cfg'
+    })
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Initialize file type mappings
-        self._code_extensions = {
+        # Initialize file type mappings; frozen because they never change
+        # after construction and frozenset membership is the hot operation.
+        self._code_extensions = frozenset({
             '.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.cs',
             '.rb', '.php', '.go', '.rs', '.swift', '.kt', '.scala',
             '.html', '.css', '.scss', '.sass', '.jsx', '.tsx', '.vue'
-        }
-        
-        self._doc_extensions = {
+        })
+
+        self._doc_extensions = frozenset({
             '.md', '.rst', '.txt', '.doc', '.docx', '.pdf',
             '.adoc', '.wiki', '.org', '.rdoc'
-        }
-        
-        self._config_extensions = {
+        })
+
+        self._config_extensions = frozenset({
             '.json', '.yml', '.yaml', '.xml', '.ini', '.conf',
             '.cfg', '.properties', '.env', '.toml'
-        }
-        
-        self._ignore_patterns = {
+        })
+
+        self._ignore_patterns = frozenset({
             '.git', '__pycache__', 'node_modules', '.idea',
             '.vscode', '.DS_Store'
-        }
-        
+        })
+
+        # One combined extension -> kind map so classification is a single
+        # dict probe instead of three membership tests.
+        self._ext_to_kind: Dict[str, str] = {ext: 'code' for ext in self._code_extensions}
+        self._ext_to_kind.update((ext, 'documentation') for ext in self._doc_extensions)
+        self._ext_to_kind.update((ext, 'configuration') for ext in self._config_extensions)
+
     def classify_file(self, file_path: Path) -> str:
         """
         Classify a single file into a specific type.
@@ -48,36 +72,80 @@ class FileClassifier:
             Classification string: 'code', 'documentation', 'configuration', 'binary', or 'other'
         """
         try:
-            # Check if file should be ignored
-            if any(part in file_path.parts for part in self._ignore_patterns):
+            # Check if file should be ignored; isdisjoint is one C-level
+            # hash sweep over the path parts.
+            if not self._ignore_patterns.isdisjoint(file_path.parts):
                 return 'ignored'
-                
+
             extension = file_path.suffix.lower()
-            
+
             # Check if it's a binary file
             if self._is_binary_file(file_path):
                 return 'binary'
-                
+
             # Classify based on extension
-            if extension in self._code_extensions:
-                return 'code'
-            elif extension in self._doc_extensions:
-                return 'documentation'
-            elif extension in self._config_extensions:
-                return 'configuration'
-                
+            kind = self._ext_to_kind.get(extension)
+            if kind is not None:
+                return kind
+
             # Additional checks for files without clear extensions
-            if self._is_documentation(file_path):
-                return 'documentation'
-            elif self._is_configuration(file_path):
-                return 'configuration'
-                
-            return 'other'
-            
+            return self._classify_by_content(file_path)
+
+
         except Exception as e:
             self.logger.error(f"Error classifying {file_path}: {e}")
             return 'other'
     
+    def classify_tree(self, root: Path) -> Dict[Path, str]:
+        """
+        Classify every file under a directory in one scandir walk.
+
+        Ignored directories are pruned before descent (their contents never
+        appear in the result), and files with a known extension are
+        classified with a single dict probe on the entry name — no Path
+        construction, stat or content sniffing on that fast path. Only
+        files with unrecognized extensions fall back to the per-file
+        classify_file checks.
+
+        Args:
+            root: Directory to walk
+
+        Returns:
+            Mapping of file path to classification string
+        """
+        results: Dict[Path, str] = {}
+        ignore = self._ignore_patterns
+        ext_to_kind = self._ext_to_kind
+        stack = [os.fspath(root)]
+
+        while stack:
+            dir_path = stack.pop()
+            try:
+                it = os.scandir(dir_path)
+            except OSError as e:
+                self.logger.error(f"Error scanning {dir_path}: {e}")
+                continue
+            with it:
+                for entry in it:
+                    name = entry.name
+                    if name in ignore:
+                        if entry.is_file(follow_symlinks=False):
+                            results[Path(entry.path)] = 'ignored'
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    # String-level suffix: avoids building a Path just to
+                    # read .suffix. A leading dot alone (.env) counts.
+                    dot = name.rfind('.')
+                    extension = name[dot:].lower() if dot >= 0 else ''
+                    kind = ext_to_kind.get(extension)
+                    if kind is None:
+                        kind = self.classify_file(Path(entry.path))
+                    results[Path(entry.path)] = kind
+
+        return results
+
     def _is_binary_file(self, file_path: Path) -> bool:
         """
         Check if a file is binary.
@@ -99,52 +167,36 @@ class FileClassifier:
         except Exception:
             return False
     
-    def _is_documentation(self, file_path: Path) -> bool:
-        """
-        Check if a file is documentation based on content patterns.
-        
-        Args:
-            file_path: Path to the file
-            
-        Returns:
-            True if file is documentation, False otherwise
-        """
-        try:
-            if file_path.name.lower() in {'readme', 'contributing', 'changelog', 'license'}:
-                return True
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read(1024).lower()
-                doc_patterns = {'# documentation', '## overview', '# introduction',
-                              '# guide', '# tutorial', '# readme'}
-                return any(pattern in content for pattern in doc_patterns)
-                
-        except Exception:
-            return False
-    
-    def _is_configuration(self, file_path: Path) -> bool:
+    def _classify_by_content(self, file_path: Path) -> str:
         """
-        Check if a file is configuration based on content patterns.
-        
+        Classify a file without a recognized extension by name and content.
+
+        The head of the file is read once and shared between the
+        documentation and configuration pattern checks, where the old
+        per-check helpers opened and lower-cased it separately.
+
         Args:
             file_path: Path to the file
-            
+
         Returns:
-            True if file is configuration, False otherwise
+            'documentation', 'configuration', or 'other'
         """
+        if file_path.name.lower() in self._DOC_FILENAMES:
+            return 'documentation'
+
         try:
-            config_filenames = {
-                'config', 'settings', '.env', 'dockerfile', 'makefile',
-                'requirements.txt', 'package.json', 'setup.cfg'
-            }
-            
-            if file_path.stem.lower() in config_filenames:
-                return True
-                
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read(1024).lower()
-                config_patterns = {'config:', 'settings:', '[settings]', 'env ='}
-                return any(pattern in content for pattern in config_patterns)
-                
+                head = f.read(1024)
         except Exception:
-            return False
\ No newline at end of file
+            head = None
+
+        if head is not None and self._DOC_RE.search(head):
+            return 'documentation'
+
+        if file_path.stem.lower() in self._CONFIG_FILENAMES:
+            return 'configuration'
+
+        if head is not None and self._CFG_RE.search(head):
+            return 'configuration'
+
+        return 'other'
\ No newline at end of file
@@ -2,10 +2,378 @@
 Language detection module for identifying programming languages and build systems in a repository.
 """
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Optional, Tuple
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Optional, Set, Tuple
 import logging
+import mmap
+import os
 import re
+import sys
+
+def _intern_table(table: Dict[str, str]) -> MappingProxyType:
+    """Intern keys and values so the hot lookups compare by pointer.
+
+    Extensions and language names flow into dict probes and Counter
+    updates for every file; interning them at import gives those the
+    identity fast path, matching how the indexer treats module names.
+    """
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in table.items()})
+
+# Trees below this size are analyzed serially; pool startup would cost
+# more than the work saved.
+_PARALLEL_MIN_FILES = 32
+
+# Files above this size skip the comment-aware scan for a raw newline
+# count (see _estimate_loc_mmap).
+_LARGE_FILE_BYTES = 2_000_000
+
+# Pure constants shared by every detector instance; MappingProxyType and
+# frozenset keep them immutable, so instantiation allocates nothing.
+_EXTENSION_MAP = _intern_table({
+    # Common programming languages
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.cs': 'C#',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala',
+    
+    # Web technologies
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.sass': 'SASS',
+    '.jsx': 'React',
+    '.tsx': 'React',
+    '.vue': 'Vue',
+    
+    # Shell scripts
+    '.sh': 'Shell',
+    '.bash': 'Shell',
+    '.zsh': 'Shell',
+    
+    # Data formats
+    '.sql': 'SQL',
+    '.r': 'R',
+    '.json': 'JSON',
+    '.yml': 'YAML',
+    '.yaml': 'YAML',
+    '.xml': 'XML',
+    '.proto': 'Protobuf',
+})
+
+_BUILD_SYSTEMS = _intern_table({
+    # Make
+    'makefile': 'Makefile',
+    'gnumakefile': 'Makefile',
+    'kbuild': 'Makefile',
+    
+    # CMake
+    'cmakelists.txt': 'CMake',
+    'cmakefile': 'CMake',
+    
+    # Gradle
+    'build.gradle': 'Gradle',
+    'build.gradle.kts': 'Gradle',
+    'settings.gradle': 'Gradle',
+    'settings.gradle.kts': 'Gradle',
+    
+    # Maven
+    'pom.xml': 'Maven',
+    
+    # Ant
+    'build.xml': 'Ant',
+    
+    # Bazel
+    'build.bazel': 'Bazel',
+    'workspace.bazel': 'Bazel',
+    'build': 'Bazel',
+    'workspace': 'Bazel',
+    
+    # NPM/Node.js
+    'package.json': 'NPM',
+    'package-lock.json': 'NPM',
+    
+    # Python
+    'setup.py': 'Python-Build',
+    'requirements.txt': 'Python-Build',
+    'pyproject.toml': 'Python-Build',
+    'poetry.lock': 'Python-Build',
+    
+    # Docker
+    'dockerfile': 'Docker',
+    'docker-compose.yml': 'Docker',
+    'docker-compose.yaml': 'Docker',
+    
+    # Other build systems
+    'rakefile': 'Rake',
+    'gruntfile.js': 'Grunt',
+    'gulpfile.js': 'Gulp',
+    'webpack.config.js': 'Webpack',
+})
+
+# Languages that might need content verification
+_AMBIGUOUS_EXTENSIONS = frozenset({'.h', '.txt', '.in'})
+
+# Assets that can never match a language or build system; classified
+# without lowercased name lookups or file reads.
+_BINARY_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.bmp', '.webp',
+    '.pdf', '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z',
+    '.so', '.a', '.o', '.dll', '.dylib', '.exe', '.bin',
+    '.jar', '.class', '.pyc', '.pyo', '.wasm',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.mp3', '.mp4', '.wav', '.avi', '.mov',
+})
+
+_MAKEFILE_PREFIX = 'makefile.'
+_CMAKE_SUFFIX = '.cmake'
+# Suffixes whose build system is decided by content analysis
+_BUILD_CONTENT_SUFFIXES = ('.in', '.ac', '.am')
+
+# Extensions that also occur in build-system filenames (setup.py,
+# package.json, pom.xml, ...); files carrying them cannot skip the
+# filename lookup in _detect_build_system.
+_BUILD_SYSTEM_EXTS = frozenset(
+    os.path.splitext(name)[1] for name in _BUILD_SYSTEMS if '.' in name
+)
+
+# Language-specific comment patterns
+_COMMENT_PATTERNS = MappingProxyType({
+    'Python': {
+        'single_line': ['#'],
+        'multi_line': ['"""', "'''"],
+        'nested_allowed': True  # Python allows nested multi-line comments
+    },
+    'JavaScript': {
+        'single_line': ['//'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'TypeScript': {
+        'single_line': ['//'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'Java': {
+        'single_line': ['//'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'C': {
+        'single_line': ['//'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'C++': {
+        'single_line': ['//'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'Ruby': {
+        'single_line': ['#'],
+        'multi_line': [('=begin', '=end')],
+        'nested_allowed': False
+    },
+    'PHP': {
+        'single_line': ['//','#'],
+        'multi_line': [('/*', '*/'), ('/**', '*/')],
+        'nested_allowed': False
+    },
+    'Go': {
+        'single_line': ['//'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'Shell': {
+        'single_line': ['#'],
+        'multi_line': [],
+        'nested_allowed': False
+    },
+    'SQL': {
+        'single_line': ['--'],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'HTML': {
+        'single_line': [],
+        'multi_line': [('<!--', '-->')],
+        'nested_allowed': False
+    },
+    'CSS': {
+        'single_line': [],
+        'multi_line': [('/*', '*/')],
+        'nested_allowed': False
+    },
+    'Makefile': {
+        'single_line': ['#'],
+        'multi_line': [],
+        'nested_allowed': False
+    },
+    'CMake': {
+        'single_line': ['#'],
+        'multi_line': [('#[[', ']]')],
+        'nested_allowed': True
+    }
+})
+
+# One detector per pool worker, built lazily on first task.
+_WORKER_DETECTOR: Optional['LanguageDetector'] = None
+
+def _analyze_file(args: Tuple[str, str, str]) -> Tuple[Optional[str], Optional[str], int]:
+    """Classify one file in a pool worker (see detect_languages)."""
+    global _WORKER_DETECTOR
+    detector = _WORKER_DETECTOR
+    if detector is None:
+        detector = _WORKER_DETECTOR = LanguageDetector()
+    path, name, extension = args
+    node = SimpleNamespace(name=name, path=Path(path), extension=extension)
+    return detector._classify_node(node)
+
+# All patterns compiled once at import: every analyzed file pays a dict
+# lookup instead of a trip through re's bounded compile cache.
+_CMAKE_RE = re.compile(r'cmake_minimum_required|project\s*\(', re.IGNORECASE)
+_MAKEFILE_RE = re.compile(r'^\w+\s*:.*\n\t.*$', re.MULTILINE)
+
+# Quote tokens per language, longest first so triple quotes win over a
+# bare quote. The double/single pair is shared by every C-like language.
+_C_LIKE_QUOTES = ('"', "'")
+_STRING_QUOTES: Dict[str, Tuple[str, ...]] = {
+    'Python': ('"""', "'''", '"', "'"),
+    'C++': _C_LIKE_QUOTES,
+    'C': _C_LIKE_QUOTES,
+    'Java': _C_LIKE_QUOTES,
+    'R': _C_LIKE_QUOTES,
+    'Rust': _C_LIKE_QUOTES,
+    'Go': _C_LIKE_QUOTES,
+    # Add quote tokens for other languages as needed
+}
+_DEFAULT_QUOTES = ('"',)  # Default to simple strings
+
+def _skip_string(content: str, i: int, quote: str) -> int:
+    """Return the index just past the literal opened by ``quote`` at ``i``.
+
+    Escaped closers are recognized by backslash parity. An unterminated
+    literal consumes the rest of the content.
+    """
+    find = content.find
+    pos = i + len(quote)
+    while True:
+        closer = find(quote, pos)
+        if closer == -1:
+            return len(content)
+        backslashes = closer - 1
+        while backslashes >= 0 and content[backslashes] == '\\':
+            backslashes -= 1
+        if (closer - 1 - backslashes) % 2 == 0:
+            return closer + len(quote)
+        pos = closer + 1
+
+def _skip_block_comment(content: str, i: int, start: str, end: str, nested: bool) -> int:
+    """Return the index just past the block comment opened at ``i``."""
+    find = content.find
+    i += len(start)
+    if not nested:
+        closer = find(end, i)
+        return len(content) if closer == -1 else closer + len(end)
+    depth = 1
+    while depth:
+        opener = find(start, i)
+        closer = find(end, i)
+        if closer == -1:
+            return len(content)
+        if opener != -1 and opener < closer:
+            depth += 1
+            i = opener + len(start)
+        else:
+            depth -= 1
+            i = closer + len(end)
+    return i
+
+def _count_loc_streaming(content: str, single_line: Tuple[str, ...],
+                         block_pairs: Tuple[Tuple[str, str], ...],
+                         nested_allowed: bool, quotes: Tuple[str, ...]) -> int:
+    """Count code lines in one pass over the content.
+
+    Fuses the old mask-strings / strip-comments / split-and-filter
+    pipeline, which materialized up to four full copies of the file, into
+    a single scan that never builds an intermediate string. str.find
+    jumps between the interesting characters (newlines, quote and comment
+    heads); a line is counted when it ends having carried at least one
+    character that belongs to neither a comment nor a string literal.
+    Newlines inside block comments and string literals do not end a line,
+    matching the old behaviour of deleting those spans before splitting.
+    """
+    heads = {'\n'}
+    heads.update(tok[0] for tok in single_line)
+    heads.update(pair[0][0] for pair in block_pairs)
+    heads.update(q[0] for q in quotes)
+
+    find = content.find
+    n = len(content)
+    count = 0
+    line_has_code = False
+    i = 0
+    while i < n:
+        # Jump to the next character that could change state.
+        nxt = n
+        for head in heads:
+            pos = find(head, i)
+            if pos != -1 and pos < nxt:
+                nxt = pos
+        if not line_has_code and nxt > i and not content[i:nxt].isspace():
+            line_has_code = True
+        i = nxt
+        if i >= n:
+            break
+        ch = content[i]
+        if ch == '\n':
+            if line_has_code:
+                count += 1
+                line_has_code = False
+            i += 1
+            continue
+        handled = False
+        for start, end in block_pairs:
+            if content.startswith(start, i):
+                i = _skip_block_comment(content, i, start, end, nested_allowed)
+                handled = True
+                break
+        if handled:
+            continue
+        for quote in quotes:
+            if content.startswith(quote, i):
+                i = _skip_string(content, i, quote)
+                handled = True
+                break
+        if handled:
+            continue
+        for tok in single_line:
+            if content.startswith(tok, i):
+                # Comment runs to end of line; leave the newline in place.
+                pos = find('\n', i)
+                i = n if pos == -1 else pos
+                handled = True
+                break
+        if handled:
+            continue
+        # An ordinary character that merely shares a head with a token.
+        line_has_code = True
+        i += 1
+    if line_has_code:
+        count += 1  # Final line without a trailing newline
+    return count
 
 class LanguageDetector:
     """
@@ -14,182 +382,22 @@ class LanguageDetector:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        
-        # Map of file extensions to programming languages
-        self._extension_map = {
-            # Common programming languages
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            
-            # Web technologies
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.sass': 'SASS',
-            '.jsx': 'React',
-            '.tsx': 'React',
-            '.vue': 'Vue',
-            
-            # Shell scripts
-            '.sh': 'Shell',
-            '.bash': 'Shell',
-            '.zsh': 'Shell',
-            
-            # Data formats
-            '.sql': 'SQL',
-            '.r': 'R',
-            '.json': 'JSON',
-            '.yml': 'YAML',
-            '.yaml': 'YAML',
-            '.xml': 'XML',
-            '.proto': 'Protobuf',
-        }
-        
-        # Build system and infrastructure files
-        self._build_systems = {
-            # Make
-            'makefile': 'Makefile',
-            'gnumakefile': 'Makefile',
-            'kbuild': 'Makefile',
-            
-            # CMake
-            'cmakelists.txt': 'CMake',
-            'cmakefile': 'CMake',
-            
-            # Gradle
-            'build.gradle': 'Gradle',
-            'build.gradle.kts': 'Gradle',
-            'settings.gradle': 'Gradle',
-            'settings.gradle.kts': 'Gradle',
-            
-            # Maven
-            'pom.xml': 'Maven',
-            
-            # Ant
-            'build.xml': 'Ant',
-            
-            # Bazel
-            'build.bazel': 'Bazel',
-            'workspace.bazel': 'Bazel',
-            'build': 'Bazel',
-            'workspace': 'Bazel',
-            
-            # NPM/Node.js
-            'package.json': 'NPM',
-            'package-lock.json': 'NPM',
-            
-            # Python
-            'setup.py': 'Python-Build',
-            'requirements.txt': 'Python-Build',
-            'pyproject.toml': 'Python-Build',
-            'poetry.lock': 'Python-Build',
-            
-            # Docker
-            'dockerfile': 'Docker',
-            'docker-compose.yml': 'Docker',
-            'docker-compose.yaml': 'Docker',
-            
-            # Other build systems
-            'rakefile': 'Rake',
-            'gruntfile.js': 'Grunt',
-            'gulpfile.js': 'Gulp',
-            'webpack.config.js': 'Webpack',
-        }
-        
-        # Languages that might need content verification
-        self._ambiguous_extensions = {'.h', '.txt', '.in'}
-
-        # Language-specific comment patterns
-        self._comment_patterns = {
-            'Python': {
-                'single_line': ['#'],
-                'multi_line': ['"""', "'''"],
-                'nested_allowed': True  # Python allows nested multi-line comments
-            },
-            'JavaScript': {
-                'single_line': ['//'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'TypeScript': {
-                'single_line': ['//'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'Java': {
-                'single_line': ['//'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'C': {
-                'single_line': ['//'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'C++': {
-                'single_line': ['//'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'Ruby': {
-                'single_line': ['#'],
-                'multi_line': [('=begin', '=end')],
-                'nested_allowed': False
-            },
-            'PHP': {
-                'single_line': ['//','#'],
-                'multi_line': [('/*', '*/'), ('/**', '*/')],
-                'nested_allowed': False
-            },
-            'Go': {
-                'single_line': ['//'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'Shell': {
-                'single_line': ['#'],
-                'multi_line': [],
-                'nested_allowed': False
-            },
-            'SQL': {
-                'single_line': ['--'],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'HTML': {
-                'single_line': [],
-                'multi_line': [('<!--', '-->')],
-                'nested_allowed': False
-            },
-            'CSS': {
-                'single_line': [],
-                'multi_line': [('/*', '*/')],
-                'nested_allowed': False
-            },
-            'Makefile': {
-                'single_line': ['#'],
-                'multi_line': [],
-                'nested_allowed': False
-            },
-            'CMake': {
-                'single_line': ['#'],
-                'multi_line': [('#[[', ']]')],
-                'nested_allowed': True
-            }
-        }
-        
+
+        # Line-count memo keyed by (path, mtime_ns, size); a changed file
+        # changes its key, so stale entries are never served.
+        self._loc_cache: Dict[Tuple[str, int, int], int] = {}
+
+        # Per-language scanner specs derived from the comment tables,
+        # built on first use by _loc_spec.
+        self._loc_specs: Dict[str, Tuple] = {}
+
+        # The lookup tables are module-level constants (see top of file);
+        # the aliases keep the old attribute names working.
+        self._extension_map = _EXTENSION_MAP
+        self._build_systems = _BUILD_SYSTEMS
+        self._ambiguous_extensions = _AMBIGUOUS_EXTENSIONS
+        self._comment_patterns = _COMMENT_PATTERNS
+
     def detect_languages(self, directory_tree) -> Tuple[Dict[str, int], Dict[str, int]]:
         """
         Detect programming languages and build systems used in the repository.
@@ -201,37 +409,80 @@ class LanguageDetector:
             Tuple of (language_stats, build_system_stats) where each is a Dict mapping
             names to lines of code/occurrences
         """
-        language_stats = {}
-        build_system_stats = {}
-        
-        def process_file(file_node) -> None:
+        # Counter's missing-key default removes the get(..., 0) second
+        # lookup on every update.
+        language_stats = Counter()
+        build_system_stats = Counter()
+
+        def merge(file_node, kind, label, lines) -> None:
+            if kind == 'build':
+                build_system_stats[label] += 1
+                file_node.language = label
+                file_node.content_type = 'build'
+            elif kind == 'language' and lines > 0:
+                language_stats[label] += lines
+                file_node.language = label
+                file_node.lines_of_code = lines
+
+        files = list(directory_tree.root.get_all_files())
+        if len(files) >= _PARALLEL_MIN_FILES:
+            # Each file is independent read + scan work, so large trees fan
+            # out to a process pool (chunked to amortize IPC); node
+            # attributes are written back here in the parent process.
+            args = [(str(f.path), f.name, f.extension) for f in files]
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(_analyze_file, args, chunksize=64)
+                for file_node, (kind, label, lines) in zip(files, results):
+                    merge(file_node, kind, label, lines)
+        else:
+            for file_node in files:
+                kind, label, lines = self._classify_node(file_node)
+                merge(file_node, kind, label, lines)
+
+        return language_stats, build_system_stats
+
+    def _classify_node(self, file_node) -> Tuple[Optional[str], Optional[str], int]:
+        """
+        Classify a single file for detect_languages.
+
+        Args:
+            file_node: Object with name, path and extension attributes
+
+        Returns:
+            ('build', system, 0), ('language', language, lines) or
+            (None, None, 0) when the file matches nothing or errors out
+        """
+        try:
+            # Almost every extension is already lowercase; islower is a C
+            # check that saves the per-file str allocation when it is.
+            ext = file_node.extension or ''
+            if not ext.islower():
+                ext = ext.lower()
+
+            # Cheapest checks first: binary assets bail outright, and most
+            # source extensions map straight to a language and never occur
+            # in a build-system filename, so they skip those lookups too.
+            if ext in _BINARY_EXTS:
+                return None, None, 0
+            if (ext in _EXTENSION_MAP and ext not in _AMBIGUOUS_EXTENSIONS
+                    and ext not in _BUILD_SYSTEM_EXTS):
+                language = _EXTENSION_MAP[ext]
+                return 'language', language, self._count_code_lines(file_node.path, language)
+
             # Check for build systems first
             build_system = self._detect_build_system(file_node)
             if build_system:
-                build_system_stats[build_system] = build_system_stats.get(build_system, 0) + 1
-                file_node.language = build_system
-                file_node.content_type = 'build'
-                return
-                
+                return 'build', build_system, 0
+
             # Then check for programming languages
-            if file_node.extension:
+            if ext:
                 language = self._detect_language(file_node)
                 if language:
-                    lines = self._count_code_lines(file_node.path)
-                    if lines > 0:
-                        language_stats[language] = language_stats.get(language, 0) + lines
-                        file_node.language = language
-                        file_node.lines_of_code = lines
-        
-        # Process all files in the directory tree
-        for file_node in directory_tree.root.get_all_files():
-            try:
-                process_file(file_node)
-            except Exception as e:
-                self.logger.error(f"Error processing {file_node.path}: {e}")
-        
-        return language_stats, build_system_stats
-    
+                    return 'language', language, self._count_code_lines(file_node.path, language)
+        except Exception as e:
+            self.logger.error(f"Error processing {file_node.path}: {e}")
+        return None, None, 0
+
     def _detect_build_system(self, file_node) -> Optional[str]:
         """
         Detect if a file is part of a build system.
@@ -242,24 +493,30 @@ class LanguageDetector:
         Returns:
             Build system name or None
         """
-        filename = file_node.name.lower()
-        
-        # Direct filename match
-        if filename in self._build_systems:
-            return self._build_systems[filename]
-            
-        # Check for Makefile variants (they might not have extensions)
-        if filename.startswith('makefile.'):
+        filename = file_node.name
+        if not filename.islower():  # Skip the copy for already-lowercase names
+            filename = filename.lower()
+
+        # Direct filename match; one probe instead of membership + fetch
+        build_system = self._build_systems.get(filename)
+        if build_system is not None:
+            return build_system
+
+        # Check for Makefile variants (they might not have extensions).
+        # This stays ahead of the suffix probes so makefile.in keeps
+        # resolving to Makefile rather than content analysis.
+        if filename.startswith(_MAKEFILE_PREFIX):
             return 'Makefile'
-            
+
         # Check for CMake module files
-        if filename.endswith('.cmake'):
+        if filename.endswith(_CMAKE_SUFFIX):
             return 'CMake'
-            
-        # Additional build system detection based on content
-        if filename.endswith(('.in', '.ac', '.am')):
+
+        # Additional build system detection based on content; endswith
+        # scans the whole suffix tuple in one C call.
+        if filename.endswith(_BUILD_CONTENT_SUFFIXES):
             return self._analyze_build_content(file_node.path)
-            
+
         return None
     
     def _analyze_build_content(self, file_path: Path) -> Optional[str]:
@@ -281,11 +538,11 @@ class LanguageDetector:
                 return 'Autotools'
                 
             # CMake detection
-            if re.search(r'cmake_minimum_required|project\s*\(', content, re.I):
+            if _CMAKE_RE.search(content):
                 return 'CMake'
-                
+
             # Makefile detection
-            if re.search(r'^\w+\s*:.*\n\t.*$', content, re.M):
+            if _MAKEFILE_RE.search(content):
                 return 'Makefile'
                 
         except Exception as e:
@@ -295,8 +552,10 @@ class LanguageDetector:
     
     def _detect_language(self, file_node) -> Optional[str]:
         """Rest of the method remains the same"""
-        extension = file_node.extension.lower()
-        
+        extension = file_node.extension
+        if not extension.islower():
+            extension = extension.lower()
+
         # Direct extension mapping
         if extension in self._extension_map:
             return self._extension_map[extension]
@@ -318,152 +577,84 @@ class LanguageDetector:
         Returns:
             Number of lines of code
         """
+        # Re-analysis runs hit the memo instead of re-reading the file; a
+        # failed stat (e.g. in-memory paths used by tests) skips caching.
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Get language-specific comment patterns
-            patterns = self._comment_patterns.get(language, {
-                'single_line': [],
-                'multi_line': [],
-                'nested_allowed': False
-            })
+            st = os.stat(file_path)
+            cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key is not None:
+            cached = self._loc_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            # Remove string literals to avoid false positives
-            content = self._mask_string_literals(content, language)
-            
-            # Handle multi-line comments first
-            if patterns['multi_line']:
-                content = self._remove_multi_line_comments(
-                    content, 
-                    patterns['multi_line'],
-                    patterns['nested_allowed']
-                )
-
-            # Split into lines and handle single-line comments
-            lines = content.split('\n')
-            code_lines = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                    
-                # Check for single-line comments
-                is_comment = False
-                for comment_start in patterns['single_line']:
-                    if line.strip().startswith(comment_start):
-                        is_comment = True
-                        break
-                
-                if not is_comment:
-                    code_lines.append(line)
+        try:
+            if cache_key is not None and cache_key[2] > _LARGE_FILE_BYTES:
+                # Multi-MB files are almost always generated or vendored;
+                # an mmap newline count is close enough for their LOC
+                # signal without decoding the whole file.
+                count = self._estimate_loc_mmap(file_path)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                count = _count_loc_streaming(content, *self._loc_spec(language))
+            if cache_key is not None:
+                self._loc_cache[cache_key] = count
+            return count
 
-            return len(code_lines)
-            
         except Exception as e:
             self.logger.warning(f"Error counting lines in {file_path}: {e}")
             return 0
 
-    def _mask_string_literals(self, content: str, language: str) -> str:
+    def _estimate_loc_mmap(self, file_path: Path) -> int:
         """
-        Mask string literals to avoid false positives in comment detection.
-        
+        Estimate lines of code for a large file.
+
+        Maps the file and counts newlines at the bytes level — no UTF-8
+        decode, no str allocation — skipping comment and string handling
+        entirely.
+
         Args:
-            content: File content
-            language: Programming language
-            
+            file_path: Path to the file
+
         Returns:
-            Content with string literals masked
+            Number of lines (a final unterminated line counts)
         """
-        import re
-        
-        # Language-specific string patterns
-        string_patterns = {
-            'Python': [
-                r'"""(?:[^"]|\\")*"""',  # Triple double quotes
-                r"'''(?:[^']|\\')*'''",  # Triple single quotes
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            'C++': [
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            'C': [
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            'Java': [
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            'R': [
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            'Rust': [
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            "Go": [
-                r'"(?:[^"\\]|\\.)*"',    # Double quotes
-                r"'(?:[^'\\]|\\.)*'"     # Single quotes
-            ],
-            # Add patterns for other languages as needed
-        }
-        
-        patterns = string_patterns.get(language, [r'"(?:[^"\\]|\\.)*"'])  # Default to simple strings
-        
-        # Replace string literals with placeholder
-        masked_content = content
-        for pattern in patterns:
-            masked_content = re.sub(pattern, '', masked_content)
-            
-        return masked_content
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # mmap has no count(); sum over 1 MB slices so bytes.count
+                # does the scanning without copying the whole mapping.
+                size = mm.size()
+                chunk = 1 << 20
+                count = 0
+                for offset in range(0, size, chunk):
+                    count += mm[offset:offset + chunk].count(b'\n')
+                if mm[-1:] != b'\n':
+                    count += 1
+                return count
 
-    def _remove_multi_line_comments(self, content: str, patterns: list, nested_allowed: bool) -> str:
-        """
-        Remove multi-line comments from the content.
-        
-        Args:
-            content: File content
-            patterns: List of multi-line comment patterns
-            nested_allowed: Whether nested comments are allowed
-            
-        Returns:
-            Content with multi-line comments removed
+    def _loc_spec(self, language: str) -> Tuple:
+        """Build (and cache) the streaming-scanner spec for a language.
+
+        Collects the single-line tokens, the (start, end) block-comment
+        pairs, the nesting flag and the string-quote tokens into one
+        tuple so _count_code_lines can splat it straight into
+        _count_loc_streaming. Python's string-style multi-line markers
+        are already covered by its quote tokens, so only tuple pairs
+        become block comments.
         """
-        for pattern in patterns:
-            if isinstance(pattern, tuple):  # Start/end style comments (/* */)
-                start, end = pattern
-                if nested_allowed:
-                    # Handle nested comments for languages like CMake
-                    nesting_level = 0
-                    result = []
-                    i = 0
-                    while i < len(content):
-                        if content[i:].startswith(start):
-                            nesting_level += 1
-                            i += len(start)
-                        elif content[i:].startswith(end):
-                            nesting_level -= 1
-                            i += len(end)
-                        elif nesting_level == 0:
-                            result.append(content[i])
-                            i += 1
-                        else:
-                            i += 1
-                    content = ''.join(result)
-                else:
-                    # Simple non-nested comment removal
-                    import re
-                    pattern = f'{re.escape(start)}.*?{re.escape(end)}'
-                    content = re.sub(pattern, '', content, flags=re.DOTALL)
-            else:  # Python-style comments (""")
-                # Handle simple multi-line comments
-                parts = content.split(pattern)
-                if len(parts) > 1:
-                    content = ''.join(parts[::2])  # Take every other part
-
-        return content
\ No newline at end of file
+        spec = self._loc_specs.get(language)
+        if spec is None:
+            patterns = self._comment_patterns.get(language)
+            if patterns is None:
+                spec = ((), (), False, _DEFAULT_QUOTES)
+            else:
+                spec = (
+                    tuple(patterns['single_line']),
+                    tuple(p for p in patterns['multi_line'] if isinstance(p, tuple)),
+                    patterns['nested_allowed'],
+                    _STRING_QUOTES.get(language, _DEFAULT_QUOTES),
+                )
+            self._loc_specs[language] = spec
+        return spec
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+On-disk cache of parsed ModuleElements for incremental re-runs.
+"""
+
+import logging
+import os
+import pickle
+from hashlib import sha1
+from pathlib import Path
+from typing import Optional
+
+from ..models.data_models import ModuleElement
+
+# Bump whenever the parser's output shape changes; stale entries simply
+# miss because the version is part of the key.
+PARSER_VERSION = 2  # 2: FunctionElement.length field; tuple-valued sequences
+
+class ModuleCache:
+    """
+    Pickle-backed cache keyed by (absolute path, mtime_ns, size, parser version).
+
+    A repo reparse normally re-runs ast.parse on every file even when nothing
+    changed; with this cache, unchanged files cost one stat plus one
+    pickle.load. Corrupt or unreadable entries are treated as misses.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.cache_dir = cache_dir
+
+    def get(self, path: str) -> Optional[ModuleElement]:
+        """Return the cached module for an unchanged file, or None on a miss."""
+        entry = self._entry_path(path)
+        if entry is None:
+            return None
+        try:
+            with open(entry, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug("Discarding unreadable cache entry for %s: %s", path, e)
+            return None
+
+    def put(self, path: str, module: ModuleElement) -> None:
+        """Store a freshly parsed module under the file's current key."""
+        entry = self._entry_path(path)
+        if entry is None:
+            return
+        try:
+            # Created lazily so merely constructing a cache never touches disk.
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(entry, 'wb') as f:
+                pickle.dump(module, f, protocol=5)
+        except Exception as e:
+            self.logger.debug("Could not cache %s: %s", path, e)
+
+    def _entry_path(self, path: str) -> Optional[Path]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}:{PARSER_VERSION}"
+        return self.cache_dir / (sha1(key.encode('utf-8')).hexdigest() + ".pkl")
@@ -0,0 +1,43 @@
+"""
+Build script for the parser engine.
+
+The hot indexing/parsing modules (repo_analyzer, python_parser) are
+compiled with Cython in pure-python mode when Cython is available;
+without Cython the package installs as plain Python, so no compiler is
+required. The modules stay valid .py files — PEP 526 annotations on hot
+locals are what Cython picks up at compile time.
+"""
+
+from setuptools import setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            "parser_engine/parser_engine/core/repo_analyzer.py",
+            "parser_engine/parser_engine/language_parsers/python_parser.py",
+            "parser_engine/parser_engine/language_parsers/python_function_call_collector.py",
+        ],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="parser-engine",
+    version="0.1.0",
+    description="Analyze GitHub repositories and transform them into structured, readable documentation",
+    packages=find_packages(),
+    ext_modules=ext_modules,
+    python_requires=">=3.10",  # dataclass(slots=True) in the data models
+    extras_require={
+        "dev": [
+            "pytest>=7.0.0",
+            "pytest-xdist>=3.0.0",
+            "black>=22.0.0",
+            "flake8>=4.0.0",
+            "mypy>=1.0.0",
+        ],
+    },
+)